@@ -16,8 +16,6 @@ from src.managers.animation.driver_manager import DriverManager
 """current issues: 
 1.) saving doesn't work, deletes everything when error so add default to layout.json
  and strictly read from layout_state.json 
-
-2.) can't interact with UIElements on menu
 """
 
 """
@@ -53,6 +51,15 @@ pygame.display.set_icon(icon)"""
 
 clock = pygame.time.Clock()
 
+#block the high-volume event types the game never reads (key releases, text input, touch, joysticks),
+#so SDL drops them before they reach event.get(); window, focus and mouse wheel events still come through
+pygame.event.set_blocked([
+    pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+])
+
 #managers act in a circular way, every one except game_manager calls every other one
 #dependencies are installed after initialization
 game_manager = GameManager()
@@ -142,12 +149,22 @@ for button_name, button in input_manager.buttons["setup"].items():
 while game_manager.running:
     frame_start = time.perf_counter()
 
-    clock.tick(game_manager.framerates[game_manager.framerate_index])
+    framerate = game_manager.framerates[game_manager.framerate_index]
+    #idle menu screens block for up to a frame period instead of spinning; the tick after it
+    #only sleeps for what is left of the period, and still caps the rate when input wakes the wait
+    waited_events = input_manager.wait_for_input(1000 // framerate)
+    clock.tick(framerate)
     screen.fill((30, 80, 150))
 
     #handles events
     event_start = time.perf_counter()
-    for event in pygame.event.get():
+    events = waited_events + pygame.event.get()
+
+    #only the last of a run of consecutive motion events matters for hover/drag, so skip the rest
+    #and carry their relative movement forward into the one that is handled
+    last_index = len(events) - 1
+    motion_dx = motion_dy = 0
+    for index, event in enumerate(events):
         if event.type == pygame.QUIT:
             game_manager.running = False
         
@@ -159,9 +176,15 @@ while game_manager.running:
             input_times.append((time.perf_counter() - input_start) * 1000)
 
         elif event.type == pygame.MOUSEMOTION:
+            rel_x, rel_y = event.rel
+            motion_dx += rel_x
+            motion_dy += rel_y
+            if index < last_index and events[index + 1].type == pygame.MOUSEMOTION:
+                continue
             x, y = event.pos
             input_start = time.perf_counter()
-            input_manager.handle_input(x, y, pygame.MOUSEMOTION)
+            input_manager.handle_input(x, y, pygame.MOUSEMOTION, (motion_dx, motion_dy))
+            motion_dx = motion_dy = 0
             input_times.append((time.perf_counter() - input_start) * 1000)
         
         elif event.type == pygame.MOUSEBUTTONUP:
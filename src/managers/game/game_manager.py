@@ -187,8 +187,8 @@ class GameManager(BaseManager):
         self.framerates = [30, 60, 120, 240]
         self.framerate_index = 2  # Default to 60 FPS
         
-        # Buy menu positioning
-        self.buy_selection_backdrop_offset = (self.screen_w / 8 * 5, self.screen_h / 8 * 7)
+        # Buy menu positioning (integer pixels, computed once from the screen size)
+        self.buy_selection_backdrop_offset = (self.screen_w * 5 // 8, self.screen_h * 7 // 8)
         self.buy_selection_offset = (50, 50)
         
         # Toggle defaults
@@ -205,7 +205,8 @@ class GameManager(BaseManager):
         """Initialize development and debugging flags."""
         self.dev_mode = False
         self.dev_mode_typing = False
-        self.dev_mode_text = ""
+        # Typed characters are appended to a list and joined once when the command is submitted
+        self.dev_mode_text_buffer: list[str] = []
         self.debugging = False
 
     ## --- LAYOUT/SETTINGS GENERATION --- ##
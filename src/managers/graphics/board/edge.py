@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from src.managers.graphics.board.tile import Tile
 
 class Edge:
+    __slots__ = ("id", "center", "adj_tiles", "adj_verts", "adj_edges")
+
     def __init__(self, id: str, center: tuple, tile1: "Tile"):
         self.id = id
         self.center = center
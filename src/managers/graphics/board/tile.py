@@ -9,8 +9,16 @@ from src.managers.graphics.board.vertex import Vertex
 if TYPE_CHECKING:
     pass
 
+# (cos, sin) of each pointy-top hexagon corner angle, so vertex positions need no trig per call
+_VERTEX_UNIT_OFFSETS = tuple(
+    (math.cos(math.pi / 3 * idx - math.pi / 2), math.sin(math.pi / 3 * idx - math.pi / 2))
+    for idx in range(6)
+)
+
 
 class Tile:
+    __slots__ = ("id", "center", "p", "q", "s", "radius", "number", "resource", "adj_tiles", "adj_edges", "adj_verts")
+
     def __init__(self, id: int, center: tuple, radius: float, number: int, resource: str, p, q, s):
         self.id = id
         self.center = center
@@ -66,10 +74,10 @@ class Tile:
         self.adj_tiles.append(neighbor)
 
     def _vertex_position(self, idx: int) -> tuple[float, float]:
-        angle = math.pi / 3 * idx - math.pi / 2
+        unit_x, unit_y = _VERTEX_UNIT_OFFSETS[idx % 6]
         return (
-            self.center[0] + math.cos(angle) * self.radius,
-            self.center[1] + math.sin(angle) * self.radius,
+            self.center[0] + unit_x * self.radius,
+            self.center[1] + unit_y * self.radius,
         )
 
     def _edge_center(self, idx: int) -> tuple[float, float]:
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from src.managers.graphics.board.tile import Tile
 
 class Vertex:
+    __slots__ = ("id", "center", "tile", "adj_tiles", "adj_verts", "adj_edges")
+
     def __init__(self, id: str, center: tuple, tile: Tile) -> None:
         self.id = id
         self.center = center
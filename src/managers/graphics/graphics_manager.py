@@ -1,4 +1,6 @@
 import math
+from functools import partial
+from types import MappingProxyType
 
 import pygame
 import numpy as np
@@ -42,9 +44,17 @@ class GraphicsManager(BaseManager):
 
         self.create_board()
 
-        self.home_ui_draw_funcs = [lambda: self.draw_ui("images", "home"), lambda: self.draw_ui("text_displays", "home"), lambda: self.draw_ui("buttons", "home"), lambda: self.draw_ui("sliders", "home"), lambda: self.draw_ui("toggles", "home"), lambda: self.draw_ui("scrollable_areas", "home")]
-        self.setup_ui_draw_funcs = [lambda: self.draw_ui("images", "setup"), lambda: self.draw_ui("text_displays", "setup"), lambda: self.draw_ui("buttons", "setup"), lambda: self.draw_ui("sliders", "setup"), lambda: self.draw_ui("toggles", "setup"), lambda: self.draw_ui("scrollable_areas", "setup")]
-        self.game_ui_draw_funcs = [lambda: self.draw_ui("tiles", "game"), lambda: self.draw_ui("images", "game"), lambda: self.draw_ui("text_displays", "game"), lambda: self.draw_ui("buttons", "game"), lambda: self.draw_ui("sliders", "game"), lambda: self.draw_ui("toggles", "game"), lambda: self.draw_ui("scrollable_areas", "game"), lambda: self.draw_board()]
+        self.home_ui_draw_funcs = [partial(self.draw_ui, "images", "home"), partial(self.draw_ui, "text_displays", "home"), partial(self.draw_ui, "buttons", "home"), partial(self.draw_ui, "sliders", "home"), partial(self.draw_ui, "toggles", "home"), partial(self.draw_ui, "scrollable_areas", "home")]
+        self.setup_ui_draw_funcs = [partial(self.draw_ui, "images", "setup"), partial(self.draw_ui, "text_displays", "setup"), partial(self.draw_ui, "buttons", "setup"), partial(self.draw_ui, "sliders", "setup"), partial(self.draw_ui, "toggles", "setup"), partial(self.draw_ui, "scrollable_areas", "setup")]
+        self.game_ui_draw_funcs = [partial(self.draw_ui, "tiles", "game"), partial(self.draw_ui, "images", "game"), partial(self.draw_ui, "text_displays", "game"), partial(self.draw_ui, "buttons", "game"), partial(self.draw_ui, "sliders", "game"), partial(self.draw_ui, "toggles", "game"), partial(self.draw_ui, "scrollable_areas", "game"), self.draw_board]
+
+        # Game state -> draw funcs; "init" shares the game screen's draw list
+        self.ui_draw_funcs_by_state = MappingProxyType({
+            "home": self.home_ui_draw_funcs,
+            "setup": self.setup_ui_draw_funcs,
+            "init": self.game_ui_draw_funcs,
+            "game": self.game_ui_draw_funcs,
+        })
 
     def draw_screen(self):
         assert self.game_manager is not None, "GraphicsManager: game_manager not set"
@@ -53,25 +63,13 @@ class GraphicsManager(BaseManager):
         if hasattr(self.game_manager, "driver_manager") and self.game_manager.driver_manager:
             self.game_manager.driver_manager.evaluate_drivers()
 
-        if (self.game_manager.game_state == "home"):
-            for func in self.home_ui_draw_funcs:
-                func()
-
-        elif (self.game_manager.game_state == "setup"):       
-            for func in self.setup_ui_draw_funcs:
-                func()
-
-        elif (self.game_manager.game_state == "init"):
-            for func in self.game_ui_draw_funcs:
-                func()
-
-        elif (self.game_manager.game_state == "game"):
-            for func in self.game_ui_draw_funcs:
-                func()
-
-        else:
+        draw_funcs = self.ui_draw_funcs_by_state.get(self.game_manager.game_state)
+        if draw_funcs is None:
             print("wrong game state")
             self.game_manager.running = False
+        else:
+            for func in draw_funcs:
+                func()
 
         self.draw_menus()
             
@@ -95,21 +93,25 @@ class GraphicsManager(BaseManager):
             element.draw(self.game_manager.screen, self.time)
 
     def draw_board(self):
+        # Bind the screen and draw functions once; this runs every frame for every tile, edge and vertex
+        screen = self.game_manager.screen
+        draw_polygon = pygame.draw.polygon
+        draw_aaline = pygame.draw.aaline
+        draw_circle = pygame.draw.circle
+
         for tile in self.board_global_tiles:
             polygon_points = [tile._vertex_position(i) for i in range(6)]
-            pygame.draw.polygon(self.game_manager.screen, (50, 50, 50), polygon_points)
-            pygame.draw.polygon(self.game_manager.screen, (110, 110, 110), polygon_points, 1)
+            draw_polygon(screen, (50, 50, 50), polygon_points)
+            draw_polygon(screen, (110, 110, 110), polygon_points, 1)
 
             for i in range(6):
-                edge_start = tile._vertex_position(i)
-                edge_end = tile._vertex_position((i + 1) % 6)
-                pygame.draw.aaline(self.game_manager.screen, (80, 80, 80), edge_start, edge_end)
+                draw_aaline(screen, (80, 80, 80), polygon_points[i], polygon_points[(i + 1) % 6])
 
         for edge in self.board_global_edges:
-            pygame.draw.circle(self.game_manager.screen, (0, 255, 120), (int(edge.center[0]), int(edge.center[1])), 4)
+            draw_circle(screen, (0, 255, 120), (int(edge.center[0]), int(edge.center[1])), 4)
 
         for vertex in self.board_global_verts:
-            pygame.draw.circle(self.game_manager.screen, (0, 120, 255), (int(vertex.center[0]), int(vertex.center[1])), 5)
+            draw_circle(screen, (0, 120, 255), (int(vertex.center[0]), int(vertex.center[1])), 5)
 
 # --- BOARD CREATION --- #
 
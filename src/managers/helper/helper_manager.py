@@ -61,12 +61,13 @@ class HelperManager(BaseManager):
 
     #TODO: proper type annotations for clickables
     def check_clickable_from_dict(self, clickables, mouse_location: tuple[int, int], offset_x = 0, offset_y = 0):
-        for name, class_instance in clickables.items():
-            if hasattr(class_instance, 'shown') and not class_instance.shown:
+        # Translate the point into the collection's space once, not per element
+        px = mouse_location[0] - offset_x
+        py = mouse_location[1] - offset_y
+        for class_instance in clickables.values():
+            if not getattr(class_instance, 'shown', True) or not getattr(class_instance, 'active', True):
                 continue
-            if hasattr(class_instance, 'active') and not class_instance.active:
-                continue
-            if class_instance.rect.collidepoint(mouse_location[0] - offset_x, mouse_location[1] - offset_y):
+            if class_instance.rect.collidepoint(px, py):
                 return class_instance
                 
         return None
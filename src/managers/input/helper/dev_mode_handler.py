@@ -1,4 +1,5 @@
 import pygame
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -15,6 +16,22 @@ from src.ui.elements.text_display import TextDisplay
 from src.ui.elements.menu import Menu
 from src.ui.layout_utils import save_ui_hierarchy, restore_ui_hierarchy
 
+# Key constant -> character for dev mode typing, built once at import
+_TYPING_KEYS = {getattr(pygame, f"K_{char}"): char for char in "abcdefghijklmnopqrstuvwxyz0123456789"}
+_TYPING_KEYS.update({
+    pygame.K_COMMA: ",",
+    pygame.K_PERIOD: ".",
+    pygame.K_MINUS: "-",
+    pygame.K_PLUS: "+",
+    pygame.K_EQUALS: "=",
+    pygame.K_SLASH: "/",
+    pygame.K_BACKSLASH: "\\",
+    pygame.K_COLON: ":",
+    pygame.K_SEMICOLON: ";",
+    pygame.K_UNDERSCORE: "_",
+    pygame.K_SPACE: " "
+})
+
 
 class DevModeHandler:
     """
@@ -79,7 +96,7 @@ class DevModeHandler:
     
     Architecture:
     - Commands entered via typing mode (T key in dev mode)
-    - Text buffer stored in game_manager.dev_mode_text
+    - Text buffer stored in game_manager.dev_mode_text_buffer (list of characters)
     - RETURN key submits command to parse_typing()
     - Commands modify active element (selected via mouse click)
     - Changes reflected immediately in UI
@@ -113,103 +130,53 @@ class DevModeHandler:
         self.mouse_handler = mouse_handler
         self.input_manager = input_manager
 
-    ## --- TEXT INPUT HANDLERS --- ##
-
-    def add_letter_key(self, key: int) -> None:
-        """
-        Add a letter key to the dev mode text input buffer.
-        
-        Args:
-            key: pygame key constant (pygame.K_a through pygame.K_z)
-        
-        Process:
-        - Check if in typing mode (early return if not)
-        - Map key constant to lowercase letter
-        - Append letter to game_manager.dev_mode_text
-        
-        Note: Only processes lowercase letters. Called from KeyboardInputHandler
-              during typing mode for every key press.
-        """
-        if not self.game_manager.dev_mode_typing:
-            return
-            
-        key_map = {
-            pygame.K_a: "a", pygame.K_b: "b", pygame.K_c: "c", pygame.K_d: "d",
-            pygame.K_e: "e", pygame.K_f: "f", pygame.K_g: "g", pygame.K_h: "h",
-            pygame.K_i: "i", pygame.K_j: "j", pygame.K_k: "k", pygame.K_l: "l",
-            pygame.K_m: "m", pygame.K_n: "n", pygame.K_o: "o", pygame.K_p: "p",
-            pygame.K_q: "q", pygame.K_r: "r", pygame.K_s: "s", pygame.K_t: "t",
-            pygame.K_u: "u", pygame.K_v: "v", pygame.K_w: "w", pygame.K_x: "x",
-            pygame.K_y: "y", pygame.K_z: "z"
+        # Commands that don't need an active element, dispatched by parse_typing().
+        # Whole-text commands take no arguments; word commands receive the full text.
+        self._exact_commands = {
+            "overridel": partial(game_manager.save_config, "layout", True),
+            "overrides": partial(game_manager.save_config, "settings", True),
+            "savehierarchy": self._save_hierarchy,
+            "loadhierarchy": self._load_hierarchy,
+            "listmenus": self._list_menus,
+            "refreshui": input_manager.reset_ui,
+            "toggle_debug": self._toggle_debugging,
         }
-        
-        if key in key_map:
-            self.game_manager.dev_mode_text += key_map[key]
-
-    def add_number_key(self, key: int) -> None:
-        """
-        Add a number key to the dev mode text input buffer.
-        
-        Args:
-            key: pygame key constant (pygame.K_0 through pygame.K_9)
-        
-        Process:
-        - Check if in typing mode (early return if not)
-        - Map key constant to numeric character
-        - Append digit to game_manager.dev_mode_text
-        
-        Note: Used for numeric command arguments like x100, y50, smax200.
-        """
-        if not self.game_manager.dev_mode_typing:
-            return
-            
-        key_map = {
-            pygame.K_0: "0", pygame.K_1: "1", pygame.K_2: "2", pygame.K_3: "3",
-            pygame.K_4: "4", pygame.K_5: "5", pygame.K_6: "6", pygame.K_7: "7",
-            pygame.K_8: "8", pygame.K_9: "9"
+        self._word_commands = {
+            "add": self._handle_add_element,
+            "deletemenu": self._delete_menu,
+            "addexclusion": self._add_exclusion,
+            "removeexclusion": self._remove_exclusion,
         }
-        
-        if key in key_map:
-            self.game_manager.dev_mode_text += key_map[key]
 
-    def add_special_key(self, key: int) -> None:
+    ## --- TEXT INPUT HANDLERS --- ##
+
+    def add_typed_key(self, key: int) -> None:
         r"""
-        Add a special character key to the dev mode text input buffer.
+        Add a typed character to the dev mode text input buffer.
         
         Args:
-            key: pygame key constant for special characters
+            key: pygame key constant (letters, digits or a supported special key)
         
         Supported Characters:
+        - Letters: a-z (lowercase)
+        - Digits: 0-9 (numeric arguments like x100, y50, smax200)
         - Punctuation: , . - + = / \ : ;
         - Underscore: _
         - Space: (spacebar)
         
         Process:
         - Check if in typing mode (early return if not)
-        - Map key constant to character
-        - Append character to game_manager.dev_mode_text
+        - Look the key up in the module-level _TYPING_KEYS table
+        - Append the character to game_manager.dev_mode_text_buffer
         
-        Note: Used for text commands, RGB colors (commas), and menu names (spaces/underscores).
+        Note: Called from KeyboardInputHandler during typing mode for every key press.
         """
         if not self.game_manager.dev_mode_typing:
             return
-            
-        key_map = {
-            pygame.K_COMMA: ",",
-            pygame.K_PERIOD: ".",
-            pygame.K_MINUS: "-",
-            pygame.K_PLUS: "+",
-            pygame.K_EQUALS: "=",
-            pygame.K_SLASH: "/",
-            pygame.K_BACKSLASH: "\\",
-            pygame.K_COLON: ":",
-            pygame.K_SEMICOLON: ";",
-            pygame.K_UNDERSCORE: "_",
-            pygame.K_SPACE: " "
-        }
-        
-        if key in key_map:
-            self.game_manager.dev_mode_text += key_map[key]
+
+        char = _TYPING_KEYS.get(key)
+        if char is not None:
+            self.game_manager.dev_mode_text_buffer.append(char)
 
     ## --- UI REFRESH --- ##
     
@@ -225,6 +192,7 @@ class DevModeHandler:
         Note: Called automatically after _handle_add_element() and _delete_active().
               Ensures hit detection works with modified UI element collections.
         """
+        self.input_manager.invalidate_ui_element_index()
         self.input_manager.mouse_handler.set_ui_elements(
             self.input_manager.buttons,
             self.input_manager.toggles,
@@ -261,7 +229,7 @@ class DevModeHandler:
            - Debug: del, print_info
         
         Process:
-        1. Get command text from game_manager.dev_mode_text
+        1. Join game_manager.dev_mode_text_buffer into the command text
         2. Print command for debugging
         3. Check no-active-element commands first
         4. If no match and no active element, print error and return
@@ -269,42 +237,21 @@ class DevModeHandler:
         
         Note: Commands are case-sensitive and space-sensitive.
         """
-        text = self.game_manager.dev_mode_text
+        text = "".join(self.game_manager.dev_mode_text_buffer)
         print(f"Dev Mode Command: {text}")
         
-        # Commands that don't require an active element
-        if text.startswith("add "):
-            self._handle_add_element(text)
-            return
-        elif text == "overridel":
-            self.game_manager.save_config("layout", True)
+        # Commands that don't require an active element: one lookup on the whole
+        # text, then one on its first word, instead of a startswith chain.
+        # Word commands take an argument, so a bare word ("add") is not one of them
+        exact_command = self._exact_commands.get(text)
+        if exact_command:
+            exact_command()
             return
-        elif text == "overrides":
-            self.game_manager.save_config("settings", True)
-            return
-        elif text == "savehierarchy":
-            self._save_hierarchy()
-            return
-        elif text == "loadhierarchy":
-            self._load_hierarchy()
-            return
-        elif text == "listmenus":
-            self._list_menus()
-            return
-        elif text.startswith("deletemenu"):
-            self._delete_menu(text)
-            return
-        elif text.startswith("addexclusion"):
-            self._add_exclusion(text)
-            return
-        elif text.startswith("removeexclusion"):
-            self._remove_exclusion(text)
-            return
-        elif text == "refreshui":
-            self.game_manager.input_manager.reset_ui()
-            return
-        elif text == "toggle_debug":
-            self.game_manager.debugging = not self.game_manager.debugging
+
+        command_word, space, _ = text.partition(" ")
+        word_command = self._word_commands.get(command_word) if space else None
+        if word_command:
+            word_command(text)
             return
         
         if not self.mouse_handler.active:
@@ -314,6 +261,10 @@ class DevModeHandler:
         # Use command mapping for cleaner parsing
         self._execute_command(text)
 
+    def _toggle_debugging(self) -> None:
+        """Flip game_manager.debugging (performance stats printing)."""
+        self.game_manager.debugging = not self.game_manager.debugging
+
     ## --- COMMAND EXECUTION --- ##
 
     def _execute_command(self, text: str) -> None:
@@ -434,6 +385,8 @@ class DevModeHandler:
 
         if changed:
             self._invalidate_active_rect_cache()
+            # The edit may have been a rename; name lookups must not return stale entries
+            self.input_manager.invalidate_ui_element_index()
 
         if isinstance(self.mouse_handler.active, ScrollableArea):
             self.mouse_handler.active.calculate_dependent_properties()
@@ -480,6 +433,8 @@ class DevModeHandler:
 
         if changed:
             self._invalidate_active_rect_cache()
+            # The edit may have been a rename; name lookups must not return stale entries
+            self.input_manager.invalidate_ui_element_index()
 
         if isinstance(self.mouse_handler.active, ScrollableArea):
             self.mouse_handler.active.calculate_dependent_properties()
@@ -716,8 +671,9 @@ class DevModeHandler:
             "guiding_lines": self.game_manager.default_guiding_lines,
             "height": self.game_manager.default_height,
             "center_width": self.game_manager.default_center_width,
-            "color": list(self.game_manager.default_fill_color),
-            "handle_color": list(self.game_manager.default_handle_color),
+            # Defaults are immutable tuples and Toggle only reads them (get_layout copies), so no list() copy
+            "color": self.game_manager.default_fill_color,
+            "handle_color": self.game_manager.default_handle_color,
             "toggle_gap": self.game_manager.default_toggle_gap,
             "time_to_flip": self.game_manager.default_time_to_flip
         }
@@ -1010,6 +966,7 @@ class DevModeHandler:
         
         # Remove from menus dict
         del self.input_manager.menus[menu_name]
+        self.input_manager.invalidate_ui_element_index()
         print(f"Deleted menu: {menu_name}")
     
     def _add_exclusion(self, command: str) -> None:
@@ -8,6 +8,13 @@ if TYPE_CHECKING:
     from src.managers.input.helper.mouse_input_handler import MouseInputHandler
     from src.managers.input.helper.dev_mode_handler import DevModeHandler
 
+# Arrow key -> (dx, dy) nudge applied to the active element in dev mode
+_ARROW_OFFSETS = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
 
 class KeyboardInputHandler:
     """
@@ -52,10 +59,22 @@ class KeyboardInputHandler:
         """
         Initialize KeyboardInputHandler.
         
+        Builds the key -> handler tables used by handle_keyboard.
+
         Note: Manager references are set separately via set_managers() and
               set_dev_mode_handler() to avoid circular import issues.
         """
-        pass  # All dependencies injected via setters
+        # Shortcuts available whenever typing mode is off
+        self._global_keys = {
+            pygame.K_m: self._toggle_mute,
+            pygame.K_0: self._toggle_dev_mode,
+        }
+        # Commands that only run in dev mode
+        self._dev_mode_keys = {
+            pygame.K_s: self._save_configs,
+            pygame.K_r: self._restore_configs,
+            pygame.K_t: self._start_typing,
+        }
 
     ## --- DEPENDENCY INJECTION --- ##
 
@@ -107,36 +126,31 @@ class KeyboardInputHandler:
         Control Flow:
         - ESC → _handle_escape() → return
         - If typing mode → _handle_typing_mode() → return
-        - M key → toggle mute (always available)
-        - 0 key → toggle dev mode → return
+        - M / 0 → looked up in _global_keys → return
         - If not dev mode → return (stop processing)
         - Arrow keys → move active element → return
-        - S key → save configs → return
-        - R key → restore configs → return
-        - T key → enter typing mode → return
+        - S / R / T → looked up in _dev_mode_keys
         """
         # Priority 1: Global ESC key (highest priority)
         if key == pygame.K_ESCAPE:
             self._handle_escape()
             return
         
-        
+        game_manager = self.game_manager
+
         # Handle typing mode
-        if self.game_manager.dev_mode_typing:
+        if game_manager.dev_mode_typing:
             self._handle_typing_mode(key)
             return
         
-        #if not typing, handle other global keys
-        if key == pygame.K_m:
-            self.audio_manager.toggle_mute()
-
-        # Toggle dev mode
-        if key == pygame.K_0:
-            self._toggle_dev_mode()
+        #if not typing, handle other global keys (mute, dev mode toggle)
+        handler = self._global_keys.get(key)
+        if handler:
+            handler()
             return
 
         # Dev mode only logic below this point
-        if not self.game_manager.dev_mode:
+        if not game_manager.dev_mode:
             return
 
         # Move active object (arrow keys)
@@ -144,25 +158,10 @@ class KeyboardInputHandler:
             if self._handle_arrow_keys(key):
                 return
 
-        # Save layout
-        if key == pygame.K_s:
-            self.game_manager.save_config("layout", False)
-            self.game_manager.save_config("settings", False)
-            return
-
-        #restore configs
-        if key == pygame.K_r:
-            self.game_manager.restore_config("settings")
-            self.game_manager.restore_config("layout")
-            return
-
-
-
-        # Start typing mode
-        if key == pygame.K_t and not self.game_manager.dev_mode_typing:
-            self.game_manager.dev_mode_typing = True
-            self.game_manager.dev_mode_text = ""
-            return
+        # Save, restore or start typing
+        handler = self._dev_mode_keys.get(key)
+        if handler:
+            handler()
 
 
     ## --- GLOBAL SHORTCUTS --- ##
@@ -185,7 +184,11 @@ class KeyboardInputHandler:
                 menu.close()
         elif self.game_manager.dev_mode_typing:
             self.game_manager.dev_mode_typing = False
-            self.game_manager.dev_mode_text = ""
+            self.game_manager.dev_mode_text_buffer.clear()
+
+    def _toggle_mute(self) -> None:
+        """Toggle audio mute (triggered by M key)."""
+        self.audio_manager.toggle_mute()
 
     ## --- DEV MODE MANAGEMENT --- ##
 
@@ -214,7 +217,22 @@ class KeyboardInputHandler:
 
         # Stop typing mode when toggling dev mode
         self.game_manager.dev_mode_typing = False
-        self.game_manager.dev_mode_text = ""
+        self.game_manager.dev_mode_text_buffer.clear()
+
+    def _save_configs(self) -> None:
+        """Save layout and settings configs (triggered by S key in dev mode)."""
+        self.game_manager.save_config("layout", False)
+        self.game_manager.save_config("settings", False)
+
+    def _restore_configs(self) -> None:
+        """Restore settings and layout configs from backup (triggered by R key in dev mode)."""
+        self.game_manager.restore_config("settings")
+        self.game_manager.restore_config("layout")
+
+    def _start_typing(self) -> None:
+        """Enter typing mode with an empty buffer (triggered by T key in dev mode)."""
+        self.game_manager.dev_mode_typing = True
+        self.game_manager.dev_mode_text_buffer.clear()
 
     ## --- DEV MODE INPUT HANDLING --- ##
 
@@ -239,19 +257,11 @@ class KeyboardInputHandler:
         """
         assert self.mouse_handler.active is not None
         
-        if key == pygame.K_UP:
-            self.mouse_handler.active.dev_mode_drag(0, -1)
-            return True
-        if key == pygame.K_DOWN:
-            self.mouse_handler.active.dev_mode_drag(0, 1)
-            return True
-        if key == pygame.K_LEFT:
-            self.mouse_handler.active.dev_mode_drag(-1, 0)
-            return True
-        if key == pygame.K_RIGHT:
-            self.mouse_handler.active.dev_mode_drag(1, 0)
-            return True
-        return False
+        offset = _ARROW_OFFSETS.get(key)
+        if offset is None:
+            return False
+        self.mouse_handler.active.dev_mode_drag(*offset)
+        return True
 
     def _handle_typing_mode(self, key: int) -> None:
         """
@@ -266,12 +276,10 @@ class KeyboardInputHandler:
         - ESC: Handled before this method (exits typing mode without submission)
         
         Text Input:
-        - Letters: Added via dev_mode_handler.add_letter_key()
-        - Numbers: Added via dev_mode_handler.add_number_key()
-        - Special chars: Added via dev_mode_handler.add_special_key()
+        - Letters, numbers and special chars: Added via dev_mode_handler.add_typed_key()
         
         Text Buffer:
-        - Stored in game_manager.dev_mode_text
+        - Stored as a character list in game_manager.dev_mode_text_buffer
         - Displayed on screen during typing mode
         - Cleared after command submission or ESC
         """
@@ -280,12 +288,13 @@ class KeyboardInputHandler:
             if self.dev_mode_handler:
                 self.dev_mode_handler.parse_typing()
             self.game_manager.dev_mode_typing = False
-            self.game_manager.dev_mode_text = ""
+            self.game_manager.dev_mode_text_buffer.clear()
             return
 
         # Backspace
         if key == pygame.K_BACKSPACE:
-            self.game_manager.dev_mode_text = self.game_manager.dev_mode_text[:-1]
+            if self.game_manager.dev_mode_text_buffer:
+                self.game_manager.dev_mode_text_buffer.pop()
             return
 
         # Shift-aware special handling
@@ -294,11 +303,9 @@ class KeyboardInputHandler:
         mods = pygame.key.get_mods()
         shift_held = bool(mods & pygame.KMOD_SHIFT)
         if shift_held and key == pygame.K_MINUS:
-            self.game_manager.dev_mode_text += "_"
+            self.game_manager.dev_mode_text_buffer.append("_")
             return
 
         # Add characters to buffer (letters, numbers, special chars)
         if self.dev_mode_handler:
-            self.dev_mode_handler.add_letter_key(key)
-            self.dev_mode_handler.add_number_key(key)
-            self.dev_mode_handler.add_special_key(key)
+            self.dev_mode_handler.add_typed_key(key)
@@ -1,5 +1,5 @@
 import pygame
-import math
+from types import MappingProxyType
 from typing import Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,6 +15,9 @@ from src.ui.elements.image import Image
 from src.ui.elements.menu import Menu
 from src.ui.elements.scrollable_area import ScrollableArea
 
+# Shared read-only stand-in for "no elements here", so hit-test lookups don't allocate empty dicts
+_EMPTY = MappingProxyType({})
+
 
 class MouseInputHandler:
     """
@@ -56,7 +59,6 @@ class MouseInputHandler:
         - clicked: True between button_down and button_up
         - start_x/y: Mouse position when button was pressed
         - click_end_x/y: Mouse position when button was released
-        - prev_dx/dy: Previous delta for smooth drag calculations
         
         UI Element Collections:
         - buttons, toggles, sliders: Organized by state/tab
@@ -70,8 +72,13 @@ class MouseInputHandler:
         self.start_y = 0  # Y position when button pressed
         self.click_end_x = 0  # X position when button released
         self.click_end_y = 0  # Y position when button released
-        self.prev_dx = 0  # Previous delta X for smooth dragging
-        self.prev_dy = 0  # Previous delta Y for smooth dragging
+
+        # Button event type -> handler, so handle_mouse_input does one lookup instead of an if/elif chain.
+        # Motion is the most frequent event and needs the relative movement, so it has its own fast path.
+        self._event_handlers = {
+            pygame.MOUSEBUTTONDOWN: self._handle_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._handle_mouse_button_up,
+        }
         
         # UI element references (populated by set_ui_elements)
         self.buttons: Dict = {}
@@ -193,7 +200,7 @@ class MouseInputHandler:
 
     ## --- MOUSE EVENT DISPATCHING --- ##
   
-    def handle_mouse_input(self, x: int, y: int, event_type: int) -> None:
+    def handle_mouse_input(self, x: int, y: int, event_type: int, rel: tuple[int, int] = (0, 0)) -> None:
         """
         Main entry point for handling all mouse events.
         
@@ -201,18 +208,19 @@ class MouseInputHandler:
             x: Mouse X coordinate (screen space)
             y: Mouse Y coordinate (screen space)
             event_type: pygame event type (MOUSEBUTTONDOWN, MOUSEMOTION, MOUSEBUTTONUP)
+            rel: Movement since the previous motion event (event.rel), used by MOUSEMOTION
         
         Event Flow:
         1. MOUSEBUTTONDOWN: Detect clicked element, set active, record start position
         2. MOUSEMOTION: Track dragging, update slider/scrollable positions or dev mode repositioning
         3. MOUSEBUTTONUP: Execute callbacks, reset state, handle click completion
         """
-        if event_type == pygame.MOUSEBUTTONDOWN:
-            self._handle_mouse_button_down(x, y)
-        elif event_type == pygame.MOUSEMOTION:
-            self._handle_mouse_motion(x, y)
-        elif event_type == pygame.MOUSEBUTTONUP:
-            self._handle_mouse_button_up(x, y)
+        if event_type == pygame.MOUSEMOTION:
+            self._handle_mouse_motion(x, y, rel)
+            return
+        handler = self._event_handlers.get(event_type)
+        if handler:
+            handler(x, y)
 
     def _prepare_for_new_click(self, x: int, y: int) -> None:
         """Deactivate current active element and initialize click tracking state."""
@@ -224,116 +232,116 @@ class MouseInputHandler:
         self.start_y = y
         self.clicked = True
 
-    def _get_menu_tab_collection(self, collection: Dict, menu: Menu, tab: str) -> Dict:
-        """Get per-menu tab elements with fallback to legacy single-menu structure."""
-        if not isinstance(collection, dict):
-            return {}
-
-        menus_collection = collection.get("menus", {})
-        if isinstance(menus_collection, dict):
-            menu_collection = menus_collection.get(menu.name, {})
-            if isinstance(menu_collection, dict):
-                tab_collection = menu_collection.get(tab, {})
-                if isinstance(tab_collection, dict):
-                    return tab_collection
+    def _get_menu_tab_collection(self, collection: Dict, menu: Menu, tab: str, menu_collection: Dict | None = None) -> Dict:
+        """
+        Get a menu's elements for a tab.
 
-        legacy_menu_collection = collection.get("menu", {})
-        if isinstance(legacy_menu_collection, dict):
-            tab_collection = legacy_menu_collection.get(tab, {})
-            if isinstance(tab_collection, dict):
-                return tab_collection
+        The menu's own tab dict (menu.buttons, menu.toggles, ...) is the primary
+        source; elements added at runtime by dev mode live under
+        collection["menus"][menu.name][tab] (or the legacy collection["menu"][tab])
+        and are merged in when present.
+        """
+        own = menu_collection.get(tab, _EMPTY) if isinstance(menu_collection, dict) else _EMPTY
+        extra = _EMPTY
+
+        if isinstance(collection, dict):
+            menus_collection = collection.get("menus", _EMPTY)
+            legacy_menu_collection = collection.get("menu", _EMPTY)
+            if isinstance(menus_collection, dict) and isinstance(menus_collection.get(menu.name), dict):
+                extra = menus_collection[menu.name].get(tab, _EMPTY)
+            elif isinstance(legacy_menu_collection, dict):
+                extra = legacy_menu_collection.get(tab, _EMPTY)
+            if not isinstance(extra, dict):
+                extra = _EMPTY
+
+        if not extra:
+            return own
+        if not own:
+            return extra
+        return {**own, **extra}
+
+    def _find_click_candidates(self, scrollable_areas: Dict, images: Dict, text_displays: Dict, sliders: Dict, toggles: Dict, buttons: Dict, x: int, y: int, offset_x: int = 0, offset_y: int = 0):
+        """
+        Hit-test one set of element collections (a menu tab or a game state).
 
-        return {}
+        Collections are queried in selection priority order (highest first) and
+        the search stops at the first hit, so lower-priority collections are not
+        scanned once something has been found. Menus and game states share this
+        path; they only differ in which tables and offsets they pass in.
 
-    def _get_menu_click_result(self, menu: Menu, x: int, y: int):
-        """Return click candidates for a specific open menu."""
-        menu_offset_x = menu.location[0]
-        menu_offset_y = menu.location[1]
-
-        button_tab_collection = self._get_menu_tab_collection(self.buttons, menu, menu.active_tab)
-        toggle_tab_collection = self._get_menu_tab_collection(self.toggles, menu, menu.active_tab)
-        slider_tab_collection = self._get_menu_tab_collection(self.sliders, menu, menu.active_tab)
-        text_tab_collection = self._get_menu_tab_collection(self.text_display, menu, menu.active_tab)
-        image_tab_collection = self._get_menu_tab_collection(self.images, menu, menu.active_tab)
-        scrollable_tab_collection = self._get_menu_tab_collection(self.scrollable_areas, menu, menu.active_tab)
-        tabs_button_collection = self._get_menu_tab_collection(self.buttons, menu, "tabs")
-
-        temp_button = self.helper_manager.check_clickable_from_dict(
-            button_tab_collection,
-            (x, y),
-            menu_offset_x,
-            menu_offset_y
-        )
-        temp_toggle = self.helper_manager.check_clickable_from_dict(
-            toggle_tab_collection,
-            (x, y),
-            menu_offset_x,
-            menu_offset_y
-        )
-        temp_slider = self.helper_manager.check_clickable_from_dict(
-            slider_tab_collection,
-            (x, y),
-            menu_offset_x,
-            menu_offset_y
-        )
+        Returns:
+            Tuple of (button, toggle, slider, text_display, image, scrollable_area, menu)
+            with at most one non-None entry (menu is always None here).
+        """
+        check = self.helper_manager.check_clickable_from_dict
+        point = (x, y)
 
-        if temp_slider and not self._check_slider_handle_collision(temp_slider, x, y, menu_offset_x, menu_offset_y):
-            temp_slider = None
+        scrollable_area_clicked = check(scrollable_areas, point, offset_x, offset_y)
+        if scrollable_area_clicked and self._check_scrollable_handle_collision(scrollable_area_clicked, x, y, offset_x, offset_y):
+            return (None, None, None, None, None, scrollable_area_clicked, None)
 
-        temp_text_display = None
         if self.game_manager.dev_mode:
-            temp_text_display = self.helper_manager.check_clickable_from_dict(
-                text_tab_collection,
-                (x, y),
-                menu_offset_x,
-                menu_offset_y
-            )
+            image_clicked = check(images, point, offset_x, offset_y)
+            if image_clicked:
+                return (None, None, None, None, image_clicked, None, None)
 
-        temp_image = None
-        if self.game_manager.dev_mode:
-            temp_image = self.helper_manager.check_clickable_from_dict(
-                image_tab_collection,
-                (x, y),
-                menu_offset_x,
-                menu_offset_y
-            )
+            text_display_clicked = check(text_displays, point, offset_x, offset_y)
+            if text_display_clicked:
+                return (None, None, None, text_display_clicked, None, None, None)
+
+        slider_clicked = check(sliders, point, offset_x, offset_y)
+        if slider_clicked and self._check_slider_handle_collision(slider_clicked, x, y, offset_x, offset_y):
+            return (None, None, slider_clicked, None, None, None, None)
 
-        temp_scrollable_area = self.helper_manager.check_clickable_from_dict(
-            scrollable_tab_collection,
+        toggle_clicked = check(toggles, point, offset_x, offset_y)
+        if toggle_clicked:
+            return (None, toggle_clicked, None, None, None, None, None)
+
+        button_clicked = check(buttons, point, offset_x, offset_y)
+        return (button_clicked, None, None, None, None, None, None)
+
+    def _get_menu_click_result(self, menu: Menu, x: int, y: int):
+        """Return click candidates for a specific open menu (active tab, then tab buttons, then backdrop)."""
+        menu_offset_x, menu_offset_y = menu.location
+        tab = menu.active_tab
+
+        result = self._find_click_candidates(
+            self._get_menu_tab_collection(self.scrollable_areas, menu, tab),
+            self._get_menu_tab_collection(self.images, menu, tab, menu.images),
+            self._get_menu_tab_collection(self.text_display, menu, tab, menu.text_displays),
+            self._get_menu_tab_collection(self.sliders, menu, tab, menu.sliders),
+            self._get_menu_tab_collection(self.toggles, menu, tab, menu.toggles),
+            self._get_menu_tab_collection(self.buttons, menu, tab, menu.buttons),
+            x, y, menu_offset_x, menu_offset_y
+        )
+        if any(result):
+            return result
+
+        tab_button = self.helper_manager.check_clickable_from_dict(
+            self._get_menu_tab_collection(self.buttons, menu, "tabs", menu.buttons),
             (x, y),
             menu_offset_x,
             menu_offset_y
         )
-        if temp_scrollable_area and not self._check_scrollable_handle_collision(temp_scrollable_area, x, y, menu_offset_x, menu_offset_y):
-            temp_scrollable_area = None
-
-        if not temp_button:
-            temp_button = self.helper_manager.check_clickable_from_dict(
-                tabs_button_collection,
-                (x, y),
-                menu_offset_x,
-                menu_offset_y
-            )
+        if tab_button:
+            return (tab_button, None, None, None, None, None, None)
 
         temp_menu = None
-        if self.game_manager.dev_mode:
-            menu_rect = pygame.Rect(
-                menu.rect.x + menu_offset_x,
-                menu.rect.y + menu_offset_y,
-                menu.rect.width,
-                menu.rect.height
-            )
-            if menu_rect.collidepoint(x, y):
-                temp_menu = menu
+        # The menu's cached absolute rect is exactly where Menu.draw() puts its backdrop
+        if self.game_manager.dev_mode and menu.get_absolute_rect().collidepoint(x, y):
+            temp_menu = menu
 
-        return (temp_button, temp_toggle, temp_slider, temp_text_display, temp_image, temp_scrollable_area, temp_menu)
+        return (None, None, None, None, None, None, temp_menu)
 
     def _get_open_menu_clicks(self, x: int, y: int, input_manager):
         """Return click candidates from highest priority open menu, or all None."""
         empty = (None, None, None, None, None, None, None)
-        open_menus_sorted = sorted(input_manager.get_open_menus(), key=lambda m: m.z_index)
+        open_menus = input_manager.get_open_menus()
+        # Common case is zero or one open menu - only sort when there's an order to decide
+        if len(open_menus) > 1:
+            open_menus.sort(key=lambda m: m.z_index)
 
-        for menu in open_menus_sorted:
+        for menu in open_menus:
             result = self._get_menu_click_result(menu, x, y)
             if any(result):
                 return result
@@ -342,38 +350,15 @@ class MouseInputHandler:
 
     def _get_game_state_clicks(self, state: str, x: int, y: int):
         """Return click candidates from the current non-menu game state."""
-        button_clicked = self.helper_manager.check_clickable_from_dict(
-            self.buttons[state], (x, y)
-        )
-        toggle_clicked = self.helper_manager.check_clickable_from_dict(
-            self.toggles[state], (x, y)
-        )
-        slider_clicked = self.helper_manager.check_clickable_from_dict(
-            self.sliders[state], (x, y)
-        )
-
-        if slider_clicked and not self._check_slider_handle_collision(slider_clicked, x, y):
-            slider_clicked = None
-
-        text_display_clicked = None
-        if self.game_manager.dev_mode:
-            text_display_clicked = self.helper_manager.check_clickable_from_dict(
-                self.text_display[state], (x, y)
-            )
-
-        image_clicked = None
-        if self.game_manager.dev_mode:
-            image_clicked = self.helper_manager.check_clickable_from_dict(
-                self.images[state], (x, y)
-            )
-
-        scrollable_area_clicked = self.helper_manager.check_clickable_from_dict(
-            self.scrollable_areas[state], (x, y)
+        return self._find_click_candidates(
+            self.scrollable_areas[state],
+            self.images[state],
+            self.text_display[state],
+            self.sliders[state],
+            self.toggles[state],
+            self.buttons[state],
+            x, y
         )
-        if scrollable_area_clicked and not self._check_scrollable_handle_collision(scrollable_area_clicked, x, y):
-            scrollable_area_clicked = None
-
-        return (button_clicked, toggle_clicked, slider_clicked, text_display_clicked, image_clicked, scrollable_area_clicked, None)
 
     def _apply_click_selection(self, button_clicked, toggle_clicked, slider_clicked, text_display_clicked, image_clicked, scrollable_area_clicked, menu_clicked) -> None:
         """Apply click candidates to active selection using existing priority order."""
@@ -433,8 +418,7 @@ class MouseInputHandler:
         state = self.game_manager.game_state
 
         # Check if any menus are open - prioritize by z-index (lower = on top)
-        from src.managers.input.input_manager import InputManager
-        input_manager = self.game_manager.input_manager if hasattr(self.game_manager, 'input_manager') else None
+        input_manager = getattr(self.game_manager, 'input_manager', None)
 
         assert input_manager is not None, "input_manager not defined"
         button_clicked, toggle_clicked, slider_clicked, text_display_clicked, image_clicked, scrollable_area_clicked, menu_clicked = self._get_open_menu_clicks(x, y, input_manager)
@@ -456,24 +440,24 @@ class MouseInputHandler:
         # Toggles should behave like buttons: update immediately on press.
         if self.active and not self.game_manager.dev_mode and isinstance(self.active, Toggle):
             self.active.set_animating(self.graphics_manager.time)
-            handler = getattr(self.active, 'callback', None)
+            handler = self.active.callback
             if handler:
                 handler()
 
-    def _handle_mouse_motion(self, x: int, y: int) -> None:
+    def _handle_mouse_motion(self, x: int, y: int, rel: tuple[int, int]) -> None:
         """
         Handle mouse motion events - detect dragging and update element positions.
         
         Args:
             x: Current mouse X coordinate
             y: Current mouse Y coordinate
+            rel: Movement since the previous motion event
         
         Process:
         1. Calculate distance from click start position
         2. If clicked and moved >5px, set dragging=True
         3. In normal mode: Update slider/scrollable positions if active
-        4. In dev mode: Move any active element by drag delta
-        5. Track previous delta for smooth incremental movement
+        4. In dev mode: Move any active element by the motion's relative movement
         
         Drag Distance Threshold:
         - >5 pixels: Considered a drag (prevents accidental drag on click)
@@ -482,30 +466,35 @@ class MouseInputHandler:
         # Calculate distance from start to current position
         dx = x - self.start_x
         dy = y - self.start_y
-        drag_distance = math.sqrt(abs(dx)**2 + abs(dy)**2)
+        # Compare squared distance against 5px squared - no sqrt needed
+        drag_distance_sq = dx * dx + dy * dy
         
-        if self.clicked and drag_distance > 5:
+        if self.clicked and drag_distance_sq > 25:
             self.dragging = True
 
         if not self.game_manager.dev_mode:
             # Handle drag updates
-            if self.dragging and isinstance(self.active, Slider):
-                self.active.update_location(x, y)
-            elif self.dragging and isinstance(self.active, ScrollableArea):
-                # Handle scrollable area's internal slider dragging
-                # Pass absolute coordinates - ScrollableArea will adjust them
-                self.active.update_scroll(x, y)
+            if self.dragging:
+                active = self.active
+                if isinstance(active, (Slider, ScrollableArea)):
+                    # Drag handlers work in the element's parent space (rect is
+                    # parent-relative), so strip the parent offset (e.g. menu location)
+                    abs_rect = active.get_absolute_rect()
+                    local_x = x - (abs_rect.x - active.rect.x)
+                    local_y = y - (abs_rect.y - active.rect.y)
+                    if isinstance(active, Slider):
+                        active.update_location(local_x, local_y)
+                    else:
+                        # Handle scrollable area's internal slider dragging
+                        active.update_scroll(local_x, local_y)
         else:
             # In dev mode, we can move any ui element around
             if self.active:
                 if self.dragging:
-                    self.active.dev_mode_drag(dx - self.prev_dx, dy - self.prev_dy)
+                    self.active.dev_mode_drag(*rel)
                 if not self.active.is_active:
                     self.active.is_active = True
 
-        self.prev_dx = dx
-        self.prev_dy = dy
-
     def _handle_mouse_button_up(self, x: int, y: int) -> None:
         """
         Handle mouse button up events - complete click/drag and execute callbacks.
@@ -529,21 +518,25 @@ class MouseInputHandler:
         self.dragging = False
         self.clicked = False
 
-        if self.active and not self.game_manager.dev_mode:
+        # In dev mode, keep elements active for command execution
+        if self.game_manager.dev_mode:
+            return
+
+        if self.active:
             self.handle_click()
 
-        # In normal mode, sliders and scrollable areas become inactive after release
-        # In dev mode, keep them active for command execution
-        if not self.game_manager.dev_mode:
-            if isinstance(self.active, Slider):
-                self.active.is_active = False
-                # Trigger slider callback after drag completes, regardless of mouse position
-                if self.active.callback:
-                    self.active.callback()
-                self.active = None
-            elif isinstance(self.active, ScrollableArea):
-                self.active.is_active = False
-                self.active = None
+        # In normal mode, sliders and scrollable areas become inactive after release.
+        # Re-read active: the click callback may have changed the selection.
+        active = self.active
+        if isinstance(active, Slider):
+            active.is_active = False
+            # Trigger slider callback after drag completes, regardless of mouse position
+            if active.callback:
+                active.callback()
+            self.active = None
+        elif isinstance(active, ScrollableArea):
+            active.is_active = False
+            self.active = None
 
     ## --- CLICK CALLBACK EXECUTION --- ##
     
@@ -561,6 +554,7 @@ class MouseInputHandler:
         Click Validation:
         - Must end inside element's rect (prevents drag-away cancellation)
         - Must account for menu offsets if element is in menu
+        - Menu elements use their cached get_absolute_rect() (offset baked in)
         - Uses _is_descendant_of() to check menu hierarchy
         
         Note: Only called in normal mode (dev mode skips callbacks on release).
@@ -569,41 +563,33 @@ class MouseInputHandler:
         y = self.click_end_y
 
         # If the click ended inside the clickable object, call its handler
-        assert self.active is not None
+        active = self.active
+        assert active is not None
         handler = None
         
         # Check if active element is in a menu
-        from src.ui.elements.menu import Menu
         clicked_in_menu = False
         
-        if isinstance(self.active, Menu):
+        if isinstance(active, Menu):
             # Menu itself was clicked (dev mode)
             clicked_in_menu = True
         else:
             # Check if element is a child of any open menu
-            input_manager = self.game_manager.input_manager if hasattr(self.game_manager, 'input_manager') else None
+            input_manager = getattr(self.game_manager, 'input_manager', None)
             if input_manager:
                 for menu in input_manager.get_open_menus():
-                    if self.active.parent == menu or self._is_descendant_of(self.active, menu):
-                        menu_offset_x = menu.location[0]
-                        menu_offset_y = menu.location[1]
-                        if pygame.rect.Rect.collidepoint(
-                            pygame.Rect(
-                                self.active.rect.x + menu_offset_x, 
-                                self.active.rect.y + menu_offset_y, 
-                                self.active.rect.w, 
-                                self.active.rect.h
-                            ), 
-                            (x, y)
-                        ):
-                            handler = getattr(self.active, 'callback', None)
+                    if active.parent == menu or self._is_descendant_of(active, menu):
+                        # Cached screen-space rect already includes the menu offset
+                        # and is only rebuilt when the menu or element moves.
+                        if active.get_absolute_rect().collidepoint(x, y):
+                            handler = active.callback
                             clicked_in_menu = True
                             break
         
         # If not in menu, check game state UI
         if not clicked_in_menu:
-            if pygame.rect.Rect.collidepoint(self.active.rect, (x, y)):
-                handler = getattr(self.active, 'callback', None)
+            if active.rect.collidepoint(x, y):
+                handler = active.callback
 
         if handler:
             handler()
@@ -1,4 +1,7 @@
+import sys
+
 import pygame
+from functools import partial
 from typing import Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -47,6 +50,7 @@ class UIFactory:
         self.game_manager = game_manager
         self.input_manager = input_manager
         self.callback_registry = {}  # Populated by register_callbacks()
+        self.callback_names = {}  # Reverse of callback_registry: callback -> name, for saving layouts
     
     ## --- CALLBACK MANAGEMENT --- ##
     
@@ -62,6 +66,10 @@ class UIFactory:
               mapped to UI elements by name during element creation.
         """
         self.callback_registry = callbacks
+        self.callback_names = {}
+        for name, callback in callbacks.items():
+            # First name wins if one callback is registered under several names
+            self.callback_names.setdefault(callback, name)
 
     def _get_callback(self, callback_name: str):
         """
@@ -138,14 +146,16 @@ class UIFactory:
         """
         result = {}
         for state in ["home", "setup", "game"]:
-            result[state] = {}
-            if state in layout and element_type in layout[state]:
-                elements_list = layout[state][element_type]
-                for element_props in elements_list:
-                    name = element_props.get('name')
-                    element = factory_func(element_props, callbacks, state)
-                    if element:
-                        result[state][name] = element
+            state_elements = result[state] = {}
+            # One lookup per state section, not one per membership test and index
+            elements_list = layout.get(state, {}).get(element_type)
+            if not elements_list:
+                continue
+            for element_props in elements_list:
+                name = element_props.get('name')
+                element = factory_func(element_props, callbacks, state)
+                if element:
+                    state_elements[sys.intern(name) if isinstance(name, str) else name] = element
         return result
 
     def _resolve_menu_tabs(self, menu_config: dict, element_config) -> list[str]:
@@ -288,20 +298,31 @@ class UIFactory:
         self.register_callbacks(callbacks)
         
         def button_factory(props, cbs, state):
-            button_name = str(props.get('name', '')).strip()
-            callback = self._resolve_callback(props)
+            return self._create_button(props, animations, drivers)
+        
+        return self._create_elements_from_layout('buttons', button_factory, callbacks)
 
-            button = Button(props, self.game_manager.font, self.game_manager, callback=callback)
-            
-            # Attach sprite animation and drivers
-            self._attach_sprite_animation(button, props, animations)
-            self._attach_drivers(button, props, drivers)
-            
-            return button
+    def _create_button(self, props: dict, animations: dict, drivers: dict) -> Button:
+        """
+        Build a single Button from its layout props (shared by state and menu buttons).
         
-        result = self._create_elements_from_layout('buttons', button_factory, callbacks)
+        Args:
+            props: Button properties from layout config
+            animations: Sprite animations dictionary keyed by element name
+            drivers: Animation drivers dictionary keyed by element name
         
-        return result
+        Returns:
+            Button: Configured button with callback, animation and drivers attached
+        """
+        game_manager = self.game_manager
+        callback = self._resolve_callback(props)
+        button = Button(props, game_manager.font, game_manager, callback=callback)
+        
+        # Attach sprite animation and drivers
+        self._attach_sprite_animation(button, props, animations)
+        self._attach_drivers(button, props, drivers)
+        
+        return button
 
     def create_all_sliders(self, callbacks, animations: dict, drivers: dict) -> Dict[str, Dict]:
         """
@@ -318,31 +339,46 @@ class UIFactory:
         - callback: Function called when slider value changes
         - Special handling for 'set_player_num' callback (wraps with int conversion)
         
-        Note: Player number slider gets lambda wrapper to convert float to int
+        Note: Player number slider is bound to set_player_num_from_slider (float -> int)
         """
         def slider_factory(props, cbs, state):
-            initial_value = props.get('initial_value', props.get('min_value', 0))
-            
-            slider = Slider(props, initial_value, self.game_manager, None)
-            
-            callback_name = props.get('callback')
-            callback_name = str(callback_name).strip() if callback_name else None
-            element_name = str(props.get('name', '')).strip()
-
-            # Handle special callbacks that need the slider value parameter
-            if callback_name == 'set_player_num' or element_name == 'player_num_slider':
-                slider.callback = lambda s=slider: cbs['set_player_num'](int(s.value))
-            else:
-                slider.callback = self._resolve_callback(props)
-            
-            # Attach sprite animation and drivers
-            self._attach_sprite_animation(slider, props, animations)
-            self._attach_drivers(slider, props, drivers)
-            
-            return slider
+            return self._create_slider(props, cbs, animations, drivers)
         
         return self._create_elements_from_layout('sliders', slider_factory, callbacks)
 
+    def _create_slider(self, props: dict, cbs: dict, animations: dict, drivers: dict) -> Slider:
+        """
+        Build a single Slider from its layout props (shared by state and menu sliders).
+        
+        Args:
+            props: Slider properties from layout config
+            cbs: Dict of callback functions from InputManager
+            animations: Sprite animations dictionary keyed by element name
+            drivers: Animation drivers dictionary keyed by element name
+        
+        Returns:
+            Slider: Configured slider with callback, animation and drivers attached
+        """
+        initial_value = props.get('initial_value', props.get('min_value', 0))
+        
+        slider = Slider(props, initial_value, self.game_manager, None)
+        
+        callback_name = props.get('callback')
+        callback_name = str(callback_name).strip() if callback_name else None
+        element_name = str(props.get('name', '')).strip()
+
+        # Handle special callbacks that need the slider value parameter
+        if callback_name == 'set_player_num' or element_name == 'player_num_slider':
+            slider.callback = partial(cbs['set_player_num_from_slider'], slider)
+        else:
+            slider.callback = self._resolve_callback(props)
+        
+        # Attach sprite animation and drivers
+        self._attach_sprite_animation(slider, props, animations)
+        self._attach_drivers(slider, props, drivers)
+        
+        return slider
+
     def create_all_toggles(self, callbacks, animations: dict, drivers: dict) -> Dict[str, Dict]:
         """
         Create all toggles (on/off switches) dynamically from layout config.
@@ -359,18 +395,33 @@ class UIFactory:
         - Requires graphics_manager.time for animation timing
         """
         def toggle_factory(props, cbs, state):
-            initial_on = props.get('on', self.game_manager.default_on)
-            callback = self._resolve_callback(props)
-            toggle = Toggle(props, self.game_manager.graphics_manager.time, self.game_manager, on=initial_on, callback=callback)
-            
-            # Attach sprite animation and drivers
-            self._attach_sprite_animation(toggle, props, animations)
-            self._attach_drivers(toggle, props, drivers)
-            
-            return toggle
+            return self._create_toggle(props, animations, drivers)
         
         return self._create_elements_from_layout('toggles', toggle_factory, callbacks)
 
+    def _create_toggle(self, props: dict, animations: dict, drivers: dict) -> Toggle:
+        """
+        Build a single Toggle from its layout props (shared by state and menu toggles).
+        
+        Args:
+            props: Toggle properties from layout config
+            animations: Sprite animations dictionary keyed by element name
+            drivers: Animation drivers dictionary keyed by element name
+        
+        Returns:
+            Toggle: Configured toggle with callback, animation and drivers attached
+        """
+        game_manager = self.game_manager
+        initial_on = props.get('on', game_manager.default_on)
+        callback = self._resolve_callback(props)
+        toggle = Toggle(props, game_manager.graphics_manager.time, game_manager, on=initial_on, callback=callback)
+        
+        # Attach sprite animation and drivers
+        self._attach_sprite_animation(toggle, props, animations)
+        self._attach_drivers(toggle, props, drivers)
+        
+        return toggle
+
     def create_all_images(self, callbacks, animations: dict, drivers: dict) -> Dict[str, Dict]:
         """
         Create all image display elements dynamically from layout config.
@@ -386,17 +437,31 @@ class UIFactory:
         - Can be used for decorative images (no callback) or interactive images (with callback)
         """
         def image_factory(props, cbs, state):
-            callback = self._resolve_callback(props)
-            image = Image(props, self.game_manager, callback=callback)
-            
-            # Attach sprite animation and drivers
-            self._attach_sprite_animation(image, props, animations)
-            self._attach_drivers(image, props, drivers)
-                    
-            return image
+            return self._create_image(props, animations, drivers)
         
         return self._create_elements_from_layout('images', image_factory, callbacks)
 
+    def _create_image(self, props: dict, animations: dict, drivers: dict) -> Image:
+        """
+        Build a single Image from its layout props (shared by state and menu images).
+        
+        Args:
+            props: Image properties from layout config
+            animations: Sprite animations dictionary keyed by element name
+            drivers: Animation drivers dictionary keyed by element name
+        
+        Returns:
+            Image: Configured image with callback, animation and drivers attached
+        """
+        callback = self._resolve_callback(props)
+        image = Image(props, self.game_manager, callback=callback)
+        
+        # Attach sprite animation and drivers
+        self._attach_sprite_animation(image, props, animations)
+        self._attach_drivers(image, props, drivers)
+                
+        return image
+
     def create_all_text_displays(self, callbacks, animations: dict, drivers: dict) -> Dict[str, Dict]:
         """
         Create all text display elements dynamically from layout config.
@@ -413,17 +478,32 @@ class UIFactory:
         - Can display static text or dynamic text (updated via callback)
         """
         def text_display_factory(props, cbs, state):
-            callback = self._resolve_callback(props)
-            text_display = TextDisplay(props, self.game_manager, self.game_manager.font, callback=callback)
-            
-            # Attach sprite animation and drivers
-            self._attach_sprite_animation(text_display, props, animations)
-            self._attach_drivers(text_display, props, drivers)
-            
-            return text_display
+            return self._create_text_display(props, animations, drivers)
         
         return self._create_elements_from_layout('text_displays', text_display_factory, callbacks)
 
+    def _create_text_display(self, props: dict, animations: dict, drivers: dict) -> TextDisplay:
+        """
+        Build a single TextDisplay from its layout props (shared by state and menu text displays).
+        
+        Args:
+            props: TextDisplay properties from layout config
+            animations: Sprite animations dictionary keyed by element name
+            drivers: Animation drivers dictionary keyed by element name
+        
+        Returns:
+            TextDisplay: Configured text display with callback, animation and drivers attached
+        """
+        game_manager = self.game_manager
+        callback = self._resolve_callback(props)
+        text_display = TextDisplay(props, game_manager, game_manager.font, callback=callback)
+        
+        # Attach sprite animation and drivers
+        self._attach_sprite_animation(text_display, props, animations)
+        self._attach_drivers(text_display, props, drivers)
+        
+        return text_display
+
     def _create_test_gradient_surface(self, width: int, height: int) -> pygame.Surface:
         """
         Create a vertical gradient surface for testing scrollable areas.
@@ -530,72 +610,30 @@ class UIFactory:
 
                     element = element_factory(element_props)
                     if element:
-                        tab_result[element_name] = element
+                        tab_result[sys.intern(element_name) if isinstance(element_name, str) else element_name] = element
 
-                result[tab_name] = tab_result
+                result[sys.intern(tab_name)] = tab_result
 
             return result
 
+        game_manager = self.game_manager
+
+        # (layout key, element builder) per menu collection, in Menu's constructor order
+        menu_element_factories = (
+            ("buttons", partial(self._create_button, animations=animations, drivers=drivers)),
+            ("toggles", partial(self._create_toggle, animations=animations, drivers=drivers)),
+            ("sliders", partial(self._create_slider, cbs=callbacks, animations=animations, drivers=drivers)),
+            ("images", partial(self._create_image, animations=animations, drivers=drivers)),
+            ("text_displays", partial(self._create_text_display, animations=animations, drivers=drivers)),
+        )
+
         def menu_factory_func(props, cbs, state):
-            buttons_config = props.get("buttons", {})
-            toggles_config = props.get("toggles", {})
-            sliders_config = props.get("sliders", {})
-            images_config = props.get("images", {})
-            text_displays_config = props.get("text_displays", {})
-
-            def button_element_factory(element_props):
-                callback = self._resolve_callback(element_props)
-                button = Button(element_props, self.game_manager.font, self.game_manager, callback=callback)
-                self._attach_sprite_animation(button, element_props, animations)
-                self._attach_drivers(button, element_props, drivers)
-                return button
-
-            def toggle_element_factory(element_props):
-                initial_on = element_props.get('on', self.game_manager.default_on)
-                callback = self._resolve_callback(element_props)
-                toggle = Toggle(element_props, self.game_manager.graphics_manager.time, self.game_manager, on=initial_on, callback=callback)
-                self._attach_sprite_animation(toggle, element_props, animations)
-                self._attach_drivers(toggle, element_props, drivers)
-                return toggle
-
-            def slider_element_factory(element_props):
-                initial_value = element_props.get('initial_value', element_props.get('min_value', 0))
-                slider = Slider(element_props, initial_value, self.game_manager, None)
-
-                callback_name = element_props.get('callback')
-                callback_name = str(callback_name).strip() if callback_name else None
-                element_name = str(element_props.get('name', '')).strip()
-
-                if callback_name == 'set_player_num' or element_name == 'player_num_slider':
-                    slider.callback = lambda s=slider: cbs['set_player_num'](int(s.value))
-                else:
-                    slider.callback = self._resolve_callback(element_props)
-
-                self._attach_sprite_animation(slider, element_props, animations)
-                self._attach_drivers(slider, element_props, drivers)
-                return slider
-
-            def image_element_factory(element_props):
-                callback = self._resolve_callback(element_props)
-                image = Image(element_props, self.game_manager, callback=callback)
-                self._attach_sprite_animation(image, element_props, animations)
-                self._attach_drivers(image, element_props, drivers)
-                return image
-
-            def text_display_element_factory(element_props):
-                callback = self._resolve_callback(element_props)
-                text_display = TextDisplay(element_props, self.game_manager, self.game_manager.font, callback=callback)
-                self._attach_sprite_animation(text_display, element_props, animations)
-                self._attach_drivers(text_display, element_props, drivers)
-                return text_display
-
-            buttons_by_tab = _build_collection(buttons_config, button_element_factory)
-            toggles_by_tab = _build_collection(toggles_config, toggle_element_factory)
-            sliders_by_tab = _build_collection(sliders_config, slider_element_factory)
-            images_by_tab = _build_collection(images_config, image_element_factory)
-            text_displays_by_tab = _build_collection(text_displays_config, text_display_element_factory)
-
-            menu = Menu(props, self.game_manager, buttons_by_tab, toggles_by_tab, sliders_by_tab, images_by_tab, text_displays_by_tab)
+            collections_by_tab = [
+                _build_collection(props.get(element_type, {}), element_factory)
+                for element_type, element_factory in menu_element_factories
+            ]
+
+            menu = Menu(props, game_manager, *collections_by_tab)
             self._attach_sprite_animation(menu, props, animations)
             self._attach_drivers(menu, props, drivers)
             return menu
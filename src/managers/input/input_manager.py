@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import partial
 from tkinter.font import names
 
 import pygame
@@ -76,6 +77,12 @@ class InputManager(BaseManager):
         self.keyboard_handler = KeyboardInputHandler()
         self.dev_mode_handler = DevModeHandler()
 
+        # Player colors are a fixed list - precompute wraparound steps for the color selector
+        color_count = len(self.game_manager.player_colors)
+        self._next_color_index = tuple((i + 1) % color_count for i in range(color_count))
+        self._prev_color_index = tuple((i - 1) % color_count for i in range(color_count))
+        self._player_color_element_names = tuple(f"player_color_{color}" for color in self.game_manager.player_colors)
+
         # Create UI elements from layout config
         self.reset_ui()
 
@@ -116,6 +123,9 @@ class InputManager(BaseManager):
         self.menus: dict[str, dict[str, Menu]] = self.ui_factory.create_all_menus(self.buttons, self.toggles, self.sliders, self.images, self.text_displays, callbacks, animations, drivers
         )
         
+        # Name lookup table is rebuilt lazily from the new collections
+        self.invalidate_ui_element_index()
+
         # Update graphics_manager's UI references for rendering
         self.set_ui_by_type()
         
@@ -153,7 +163,7 @@ class InputManager(BaseManager):
 
     ## --- INPUT DELEGATION --- ##
 
-    def handle_input(self, x: int, y: int, event_type: int) -> None:
+    def handle_input(self, x: int, y: int, event_type: int, rel: tuple[int, int] = (0, 0)) -> None:
         """
         Route mouse input to MouseInputHandler.
         
@@ -161,8 +171,55 @@ class InputManager(BaseManager):
             x: Mouse x coordinate
             y: Mouse y coordinate  
             event_type: pygame event type (MOUSEBUTTONDOWN, MOUSEMOTION, MOUSEBUTTONUP)
+            rel: Relative movement for MOUSEMOTION events (event.rel)
+        """
+        self.mouse_handler.handle_mouse_input(x, y, event_type, rel)
+
+    def should_wait_for_events(self) -> bool:
         """
-        self.mouse_handler.handle_mouse_input(x, y, event_type)
+        Check whether the main loop can block on the event queue this frame.
+
+        Menu-style states (home, setup) only change in response to input, so the
+        loop can wait for events (bounded by the frame period) instead of polling.
+        The game board keeps polling every frame, as does any frame where a drag,
+        dev mode typing, an animation driver or a toggle slide is in progress.
+
+        Returns:
+            bool: True if the current game state is input-driven and nothing is in motion
+        """
+        state = self.game_manager.game_state
+        if state not in ("home", "setup"):
+            return False
+        if self.mouse_handler.dragging or self.game_manager.dev_mode_typing:
+            return False
+        if any(driver.animating for driver in self.game_manager.driver_manager.driver_registry):
+            return False
+
+        # Toggles animate their handle for a moment after being clicked (state and open menu toggles)
+        toggle_collections = [self.toggles[state]]
+        for menu in self.get_open_menus():
+            toggle_collections.extend(menu.toggles.values())
+        return not any(toggle.animating for toggles in toggle_collections for toggle in toggles.values())
+
+    def wait_for_input(self, timeout_ms: int) -> list:
+        """
+        Block on the event queue while the UI is idle.
+
+        Args:
+            timeout_ms: Longest time to block waiting for an event
+
+        Returns:
+            list: The event that ended the wait, or empty if the UI isn't idle or the
+                  wait timed out. The rest of the queue is left for event.get().
+
+        Note: main.py calls this before clock.tick(), so the tick only sleeps for
+              whatever is left of the frame period and an idle frame still takes
+              one period, not two.
+        """
+        if not self.should_wait_for_events():
+            return []
+        event = pygame.event.wait(timeout_ms)
+        return [] if event.type == pygame.NOEVENT else [event]
 
     def handle_keyboard(self, key: int) -> None:
         """
@@ -208,12 +265,13 @@ class InputManager(BaseManager):
         """
         return {
             # Main menu callbacks
-            'set_game_state_setup': lambda: self.set_game_state("setup"),
-            'set_game_state_home': lambda: self.set_game_state("home"),
+            'set_game_state_setup': partial(self.set_game_state, "setup"),
+            'set_game_state_home': partial(self.set_game_state, "home"),
             'quit': self.quit,
             
             # Setup screen callbacks
             'start_game': self.start_game,
+            'set_player_num_from_slider': self.set_player_num_from_slider,
             'player_num_increase': self.player_num_increase,
             'player_num_decrease': self.player_num_decrease,
             'player_color_index_increase': self.player_color_index_increase,
@@ -222,27 +280,27 @@ class InputManager(BaseManager):
             'color_index_decrease': self.player_color_index_decrease,
             'points_to_win_increase': self.points_to_win_increase,
             'points_to_win_decrease': self.points_to_win_decrease,
-            'set_diff_level_easy': lambda: self._update_diff_level_ui("set_diff_level_easy", "set_diff_level_medium", "set_diff_level_hard"),
-            'set_diff_level_medium': lambda: self._update_diff_level_ui("set_diff_level_medium", "set_diff_level_easy", "set_diff_level_hard"),
-            'set_diff_level_hard': lambda: self._update_diff_level_ui("set_diff_level_hard", "set_diff_level_easy", "set_diff_level_medium"),
-            'set_robber_mode_friendly': lambda: self._update_robber_mode_ui("set_robber_mode_friendly", "set_robber_mode_standard"),
-            'set_robber_mode_standard': lambda: self._update_robber_mode_ui("set_robber_mode_standard", "set_robber_mode_friendly"),
+            'set_diff_level_easy': partial(self._update_diff_level_ui, "set_diff_level_easy", "set_diff_level_medium", "set_diff_level_hard"),
+            'set_diff_level_medium': partial(self._update_diff_level_ui, "set_diff_level_medium", "set_diff_level_easy", "set_diff_level_hard"),
+            'set_diff_level_hard': partial(self._update_diff_level_ui, "set_diff_level_hard", "set_diff_level_easy", "set_diff_level_medium"),
+            'set_robber_mode_friendly': partial(self._update_robber_mode_ui, "set_robber_mode_friendly", "set_robber_mode_standard"),
+            'set_robber_mode_standard': partial(self._update_robber_mode_ui, "set_robber_mode_standard", "set_robber_mode_friendly"),
             # Backward compatibility with older layout naming.
-            'set_robber_mode_normal': lambda: self._update_robber_mode_ui("set_robber_mode_standard", "set_robber_mode_friendly"),
-            'set_dice_mode_random': lambda: self._update_dice_mode_ui("set_dice_mode_random", "set_dice_mode_balanced"),
-            'set_dice_mode_balanced': lambda: self._update_dice_mode_ui("set_dice_mode_balanced", "set_dice_mode_random"),
+            'set_robber_mode_normal': partial(self._update_robber_mode_ui, "set_robber_mode_standard", "set_robber_mode_friendly"),
+            'set_dice_mode_random': partial(self._update_dice_mode_ui, "set_dice_mode_random", "set_dice_mode_balanced"),
+            'set_dice_mode_balanced': partial(self._update_dice_mode_ui, "set_dice_mode_balanced", "set_dice_mode_random"),
             'turn_order_increase': self.turn_order_increase,
             'turn_order_decrease': self.turn_order_decrease,
-            'time_limit_toggle': lambda: self._update_time_limit_ui(),
-            'open_menu': lambda: self.open_menu('settings'),
-            'close_menu': lambda: self.close_menu('settings'),
+            'time_limit_toggle': self._update_time_limit_ui,
+            'open_menu': partial(self.open_menu, 'settings'),
+            'close_menu': partial(self.close_menu, 'settings'),
             
             # Menu tab callbacks
-            'change_tab_input': lambda: self.change_tab("input"),
-            'change_tab_accessibility': lambda: self.change_tab("accessibility"),
-            'change_tab_gameplay': lambda: self.change_tab("gameplay"),
-            'change_tab_audio': lambda: self.change_tab("audio"),
-            'change_tab_graphics': lambda: self.change_tab("graphics"),
+            'change_tab_input': partial(self.change_tab, "input"),
+            'change_tab_accessibility': partial(self.change_tab, "accessibility"),
+            'change_tab_gameplay': partial(self.change_tab, "gameplay"),
+            'change_tab_audio': partial(self.change_tab, "audio"),
+            'change_tab_graphics': partial(self.change_tab, "graphics"),
         }
 
     ## --- GAME SETUP & PLAYER CONFIGURATION --- ##
@@ -271,13 +329,17 @@ class InputManager(BaseManager):
         self.game_manager.num_players = num
         self.text_displays["setup"]["player_num_text"].update_text(f"Number of Players: {num}")
 
+    def set_player_num_from_slider(self, slider: Slider) -> None:
+        """Set number of players from a slider's current (float) value."""
+        self.set_player_num(int(slider.value))
+
     def player_color_index_increase(self):
-        self.game_manager.player_color_chosen_index = (self.game_manager.player_color_chosen_index + 1) % len(self.game_manager.player_colors)
+        self.game_manager.player_color_chosen_index = self._next_color_index[self.game_manager.player_color_chosen_index]
 
         self._update_player_color_ui()
     
     def player_color_index_decrease(self):
-        self.game_manager.player_color_chosen_index = (self.game_manager.player_color_chosen_index - 1) % len(self.game_manager.player_colors)
+        self.game_manager.player_color_chosen_index = self._prev_color_index[self.game_manager.player_color_chosen_index]
 
         self._update_player_color_ui()
 
@@ -334,21 +396,18 @@ class InputManager(BaseManager):
 
     def _update_player_color_ui(self) -> None:
         """Sync selected player color visibility and control active states."""
-        colors = list(getattr(self.game_manager, 'player_colors', []))
-        if not colors:
+        if not self._player_color_element_names:
             return
 
-        max_index = len(colors) - 1
+        max_index = len(self._player_color_element_names) - 1
         index = max(0, min(self.game_manager.player_color_chosen_index, max_index))
         self.game_manager.player_color_chosen_index = index
-        selected_color = colors[index]
 
-        for color in colors:
-            element_name = f"player_color_{color}"
+        for i, element_name in enumerate(self._player_color_element_names):
             element = self._find_ui_element(element_name)
             if not element:
                 continue
-            if color == selected_color:
+            if i == index:
                 element.show()
             else:
                 element.hide()
@@ -473,12 +532,24 @@ class InputManager(BaseManager):
             if isinstance(collection, dict):
                 yield from walk(collection)
 
+    def _build_ui_element_index(self) -> dict[str, UIElement]:
+        """Flatten all state/tab/menu collections into a single name -> element table."""
+        index: dict[str, UIElement] = {}
+        for element in self._iter_ui_elements():
+            name = getattr(element, 'name', None)
+            if name is not None and name not in index:
+                index[name] = element
+        return index
+
+    def invalidate_ui_element_index(self) -> None:
+        """Drop the cached name index so the next lookup rebuilds it (call after add/delete/rename)."""
+        self._ui_element_index = None
+
     def _find_ui_element(self, target: str):
         """Find first UI element where key name or element.name matches target."""
-        for element in self._iter_ui_elements():
-            if getattr(element, 'name', None) == target:
-                return element
-        return None
+        if self._ui_element_index is None:
+            self._ui_element_index = self._build_ui_element_index()
+        return self._ui_element_index.get(target)
 
     def set_diff_level(self, level: str):
         """
@@ -668,8 +739,7 @@ class InputManager(BaseManager):
         if not menu or not tab_name:
             return
 
-        menu.active_tab = tab_name
-        menu.update_menu(0)
+        menu.set_active_tab(tab_name)
 
     def quit(self):
         """Signal the game to shut down by setting running flag to False."""
@@ -690,7 +760,7 @@ class InputManager(BaseManager):
         # Call the callback for setup player number slider to set initial UI text
         if "setup" in self.sliders and "player_num_slider" in self.sliders["setup"]:
             player_num_slider = self.sliders["setup"]["player_num_slider"]
-            if hasattr(player_num_slider, 'callback') and player_num_slider.callback:
+            if player_num_slider.callback:
                 player_num_slider.callback()
 
         self._update_player_num_ui()
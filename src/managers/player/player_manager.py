@@ -200,10 +200,7 @@ class PlayerManager(BaseManager):
             player.config.victory_points = value
     
     def check_winner(self):
+        """Return the first player at or above points_to_win, or None."""
         points_to_win = int(getattr(self.game_manager, 'points_to_win', 10))
-        for player in self.players:
-            if player.config.victory_points >= points_to_win:
-                return player
-
-        return None
+        return next((player for player in self.players if player.config.victory_points >= points_to_win), None)
     
\ No newline at end of file
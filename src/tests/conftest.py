@@ -0,0 +1,84 @@
+"""
+Shared fixtures for the pytest suite (run from the repository root: python -m pytest src/tests).
+
+The game relies on deferred evaluation of annotations, so the suite needs the
+same interpreter as main.py (Python 3.14+).
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Headless SDL so the game can be built without a window or sound device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pygame
+
+
+@pytest.fixture
+def game(monkeypatch):
+    """
+    Build and wire every manager the same way main.py does (everything before the game loop).
+
+    Returns:
+        dict: Manager name -> manager instance ("game_manager", "input_manager", ...)
+    """
+    from src.managers.animation.animation_manager import AnimationManager
+    from src.managers.game.game_manager import GameManager
+    from src.managers.audio.audio_manager import AudioManager
+    from src.managers.graphics.graphics_manager import GraphicsManager
+    from src.managers.helper.helper_manager import HelperManager
+    from src.managers.input.input_manager import InputManager
+    from src.managers.player.player_manager import PlayerManager
+    from src.managers.animation.driver_manager import DriverManager
+
+    # Config paths are relative to the repository root
+    monkeypatch.chdir(ROOT)
+
+    pygame.init()
+    screen = pygame.display.set_mode((1366, 768))
+
+    managers = {
+        "game_manager": GameManager(),
+        "audio_manager": AudioManager(),
+        "player_manager": PlayerManager(),
+        "graphics_manager": GraphicsManager(),
+        "input_manager": InputManager(),
+        "helper_manager": HelperManager(),
+        "animation_manager": AnimationManager(),
+        "driver_manager": DriverManager(),
+    }
+
+    # Same dependency graph as main.py
+    dependencies = {
+        "game_manager": ["input_manager", "audio_manager", "graphics_manager", "helper_manager", "player_manager", "animation_manager", "driver_manager"],
+        "input_manager": ["game_manager", "graphics_manager", "helper_manager", "player_manager", "audio_manager"],
+        "graphics_manager": ["game_manager", "input_manager", "helper_manager", "player_manager", "audio_manager"],
+        "audio_manager": ["game_manager", "input_manager", "helper_manager", "player_manager", "graphics_manager"],
+        "player_manager": ["game_manager", "input_manager", "helper_manager", "audio_manager", "graphics_manager"],
+        "driver_manager": ["game_manager", "input_manager", "helper_manager", "player_manager", "graphics_manager", "audio_manager", "animation_manager"],
+    }
+    for name, needed in dependencies.items():
+        for dependency in needed:
+            managers[name].inject(dependency, managers[dependency])
+
+    managers["game_manager"].import_dependencies(screen)
+    for name in ("graphics_manager", "input_manager", "audio_manager", "player_manager", "helper_manager", "animation_manager", "driver_manager"):
+        managers[name].import_dependencies()
+
+    managers["game_manager"].load_config("layout", False)
+    managers["graphics_manager"].init(pygame.time.get_ticks())
+    managers["input_manager"].post_init()
+    managers["driver_manager"].create_driver_registry()
+    managers["audio_manager"].post_init()
+    managers["helper_manager"].post_init()
+
+    yield managers
+
+    pygame.quit()
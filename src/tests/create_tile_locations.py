@@ -89,6 +89,10 @@ def visualize_graph(screen_w: int, screen_h: int):
     pygame.display.set_caption("Catan Graph")
     clock = pygame.time.Clock()
 
+    #the loop only reacts to quit and escape, so keep every other event type out of the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
     running = True
     while running:
         for event in pygame.event.get():
@@ -0,0 +1,63 @@
+def _run_command(game, text):
+    """Type `text` into the dev mode buffer and parse it."""
+    game_manager = game["game_manager"]
+    game_manager.dev_mode = True
+    game_manager.dev_mode_text_buffer[:] = text
+    game["input_manager"].dev_mode_handler.parse_typing()
+
+
+def test_bare_command_word_falls_through_to_active_element_commands(game, capsys):
+    """'add' without an element type is not the add command (matches the old startswith("add ") check)."""
+    game["input_manager"].mouse_handler.active = None
+
+    _run_command(game, "add")
+
+    output = capsys.readouterr().out
+    assert "Unknown element type" not in output
+    assert "No active element selected." in output
+
+
+def test_word_command_with_argument_is_dispatched(game, capsys):
+    _run_command(game, "deletemenu no_such_menu")
+
+    assert "Menu 'no_such_menu' not found" in capsys.readouterr().out
+
+
+def test_add_button_creates_button(game, capsys):
+    game_manager = game["game_manager"]
+    input_manager = game["input_manager"]
+    game_manager.game_state = "home"
+    before = set(input_manager.buttons["home"])
+
+    _run_command(game, "add button")
+
+    added = set(input_manager.buttons["home"]) - before
+    assert len(added) == 1
+    assert "Added Button" in capsys.readouterr().out
+
+
+def test_renamed_element_is_found_by_its_new_name(game):
+    input_manager = game["input_manager"]
+    play = input_manager.buttons["home"]["play"]
+    # Build the name index before the rename
+    assert input_manager._find_ui_element(play.name) is play
+    old_name = play.name
+    input_manager.mouse_handler.active = play
+
+    _run_command(game, "set name renamed_play")
+
+    assert play.name == "renamed_play"
+    assert input_manager._find_ui_element("renamed_play") is play
+    assert input_manager._find_ui_element(old_name) is not play
+
+
+def test_nested_attribute_edit_drops_name_index(game):
+    input_manager = game["input_manager"]
+    play = input_manager.buttons["home"]["play"]
+    input_manager._find_ui_element(play.name)
+    input_manager.mouse_handler.active = play
+
+    _run_command(game, "set rect.x 10")
+
+    assert play.rect.x == 10
+    assert input_manager._ui_element_index is None
@@ -0,0 +1,39 @@
+import pygame
+
+
+def test_idle_setup_screen_waits_for_events(game):
+    game["game_manager"].game_state = "setup"
+
+    assert game["input_manager"].should_wait_for_events()
+
+
+def test_animating_toggle_keeps_polling(game):
+    game_manager = game["game_manager"]
+    input_manager = game["input_manager"]
+    game_manager.game_state = "setup"
+
+    toggle = next(iter(input_manager.toggles["setup"].values()))
+    toggle.set_animating(pygame.time.get_ticks())
+
+    assert not input_manager.should_wait_for_events()
+
+
+def test_animating_menu_toggle_keeps_polling(game):
+    game_manager = game["game_manager"]
+    input_manager = game["input_manager"]
+    game_manager.game_state = "setup"
+    input_manager.open_menu("settings")
+
+    menu = input_manager.get_menu("settings")
+    toggle = next(iter(menu.toggles[menu.active_tab].values()))
+    toggle.set_animating(pygame.time.get_ticks())
+
+    assert not input_manager.should_wait_for_events()
+
+
+def test_wait_for_input_returns_immediately_when_not_idle(game):
+    game["game_manager"].game_state = "game"
+
+    start = pygame.time.get_ticks()
+    assert game["input_manager"].wait_for_input(1000) == []
+    assert pygame.time.get_ticks() - start < 500
@@ -0,0 +1,31 @@
+import pygame
+
+
+def test_dev_mode_click_selects_home_button_over_background(game):
+    """Dev-mode clicks on a home button select it, so it can be dragged and edited."""
+    game_manager = game["game_manager"]
+    input_manager = game["input_manager"]
+    game_manager.game_state = "home"
+    game_manager.dev_mode = True
+
+    play = input_manager.buttons["home"]["play"]
+    x, y = play.get_absolute_rect().center
+    input_manager.handle_input(x, y, pygame.MOUSEBUTTONDOWN)
+
+    assert input_manager.mouse_handler.active is play
+
+
+def test_dev_mode_drag_moves_home_button(game):
+    game_manager = game["game_manager"]
+    input_manager = game["input_manager"]
+    game_manager.game_state = "home"
+    game_manager.dev_mode = True
+
+    play = input_manager.buttons["home"]["play"]
+    start = play.rect.topleft
+    x, y = play.get_absolute_rect().center
+    input_manager.handle_input(x, y, pygame.MOUSEBUTTONDOWN)
+    input_manager.handle_input(x + 50, y + 25, pygame.MOUSEMOTION, (50, 25))
+    input_manager.handle_input(x + 50, y + 25, pygame.MOUSEBUTTONUP)
+
+    assert play.rect.topleft == (start[0] + 50, start[1] + 25)
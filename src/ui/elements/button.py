@@ -1,7 +1,9 @@
-from dataclasses import field
+from __future__ import annotations
+
+from functools import lru_cache
 from operator import call
 
-from attr import dataclass, fields
+from attr import Factory, dataclass, fields
 import pygame
 
 from typing import TYPE_CHECKING, Callable, Optional
@@ -11,6 +13,25 @@ if TYPE_CHECKING:
     from src.managers.game.game_manager import GameManager
 
 
+@lru_cache(maxsize=256)
+def _render_text(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+    """
+    Render a label once per (font, text, color) - static UI text is not re-rasterized every frame.
+    
+    Once the display exists, the label is converted to its pixel format so blits
+    don't convert it again every frame (buttons are created after set_mode).
+    """
+    label = font.render(text, False, color)
+    if pygame.display.get_surface() is not None:
+        label = label.convert_alpha()
+    return label
+
+
+@lru_cache(maxsize=512)
+def _text_size(font: pygame.font.Font, text: str) -> tuple[int, int]:
+    """Measure a label once per (font, text) - size is color-independent and font.size() needs no render."""
+    return font.size(text)
+
 
 class Button(UIElement):
     """
@@ -30,9 +51,7 @@ class Button(UIElement):
     - Active: Shows guiding lines (dev mode selection)
     """
 
-    text_color: tuple[int, int, int]
-
-    def __init__(self, layout_props: dict, font: pygame.font.Font, game_manager: "GameManager", background_image: pygame.Surface | None = None, callback: Optional[Callable] = None, shown: bool = True) -> None:
+    def __init__(self, layout_props: dict, font: pygame.font.Font, game_manager: GameManager, background_image: pygame.Surface | None = None, callback: Optional[Callable] = None, shown: bool = True) -> None:
         """
         Initialize button with text, colors, and visual properties.
         
@@ -54,6 +73,9 @@ class Button(UIElement):
         - disabled: If True, button is non-interactive and darkened
         - border_radius: Corner rounding (not yet implemented in draw)
         """
+        # Rounded backgrounds pre-drawn per (size, look, radii); see _get_rounded_background()
+        self._background_cache: dict[tuple, pygame.Surface] = {}
+
         # Initialize element-specific defaults
         self.text = ""
         self.color = (0, 0, 0)
@@ -77,18 +99,7 @@ class Button(UIElement):
         self.selected = False
         self.background_image = background_image
 
-        self.text_surface = self.game_font.render(self.text, False, self.text_color)
-        self.text_rect = self.text_surface.get_rect()
-        
-        if self.background_image:
-            self.surface = self.background_image
-        else:
-            self.surface = pygame.Surface((self.text_rect.width + 2 * self.padding, self.text_rect.height + 2 * self.padding))
-            self.surface.fill(self.color)
-
-        self.set_text_align(self.text_align)
-
-        # read layout after setting defaults
+        # read layout after setting defaults (update_text builds text_surface, text_rect and surface)
         self.read_layout(layout_props)
         self.update_text(self.text)
 
@@ -98,13 +109,55 @@ class Button(UIElement):
                 continue
             setattr(self, name, value)
 
+        # Warm the label cache so the first frame doesn't rasterize every button
+        _render_text(self.game_font, self.text, self.text_color)
+
+    ## --- COLORS --- ##
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        """Background color (r, g, b)."""
+        return self._color
+
+    @color.setter
+    def color(self, new_color: tuple[int, int, int]) -> None:
+        """
+        Set the background color and rebuild the per-state fill colors.
+        
+        Layout colors arrive as JSON lists, so they are stored as a tuple. The
+        normal/hover/disabled fills are built here as pygame.Color objects, so
+        draw() only has to pick one and pygame doesn't re-parse a tuple on every fill.
+        Runs for every assignment (layout, dev mode, drivers).
+        """
+        self._color = tuple(new_color)
+        self._color_pg = pygame.Color(*self._color)
+        self._color_hover_pg = pygame.Color(*(min(255, int(c * 1.2)) for c in self._color))
+        self._color_disabled_pg = pygame.Color(*(int(c * 0.5) for c in self._color))
+        # Pre-drawn rounded backgrounds were filled with the old color
+        self._background_cache.clear()
+
+    @property
+    def text_color(self) -> tuple[int, int, int]:
+        """Text color (r, g, b)."""
+        return self._text_color
+
+    @text_color.setter
+    def text_color(self, new_color: tuple[int, int, int]) -> None:
+        """
+        Set the text color and its darkened disabled variant.
+        
+        Both are plain tuples (not pygame.Color) so they can key the _render_text cache.
+        """
+        r, g, b = self._text_color = tuple(new_color)
+        self._text_color_disabled = (int(r * 0.5), int(g * 0.5), int(b * 0.5))
+
     ## --- TEXT MANAGEMENT --- ##
 
     def update_text(self, new_text: str) -> None:
-        """Update button text and regenerate text surface."""
+        """Update button text, re-measuring it (cached per font and text) and regenerating the text surface."""
         self.text = new_text
-        self.text_surface = self.font.render(self.text, True, self.text_color)
-        self.text_rect = self.text_surface.get_rect()
+        self.text_surface = _render_text(self.font, self.text, self.text_color)
+        self.text_rect = pygame.Rect((0, 0), _text_size(self.font, self.text))
 
         if self.background_image:
             self.surface = self.background_image
@@ -114,6 +167,8 @@ class Button(UIElement):
             surface_width = max(self.rect.width, desired_width)
             surface_height = max(self.rect.height, desired_height)
             self.surface = pygame.Surface((surface_width, surface_height))
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
             self.surface.fill(self.color)
 
             # If the button was created with a zero-sized rect, adopt computed size.
@@ -122,23 +177,19 @@ class Button(UIElement):
                 self.rect.height = surface_height
 
         self._invalidate_absolute_rect()
-        self.set_text_align(self.text_align)
 
     def update_text_color(self, new_color: tuple[int, int, int]) -> None:
-        """Update text color and regenerate text surface."""
+        """
+        Update text color and regenerate text surface.
+        
+        Text size doesn't depend on color, so text_rect is kept as it is.
+        """
         self.text_color = new_color
-        self.text_surface = self.font.render(self.text, True, self.text_color)
-        self.text_rect = self.text_surface.get_rect()
-        self.set_text_align(self.text_align)
+        self.text_surface = _render_text(self.font, self.text, self.text_color)
 
     def set_text_align(self, text_align: str) -> None:
-        """Position text within button based on alignment (left/center/right)."""
-        if text_align == "center":
-            self.text_rect.center = self.surface.get_rect().center
-        elif text_align == "left":
-            self.text_rect.midleft = (self.padding, self.surface.get_rect().centery)
-        elif text_align == "right":
-            self.text_rect.midright = (self.surface.get_rect().width - self.padding, self.surface.get_rect().centery)
+        """Set text alignment (left/center/right); draw() positions the label from it."""
+        self.text_align = text_align
 
     ## --- EVENT HANDLING --- ##
 
@@ -148,21 +199,28 @@ class Button(UIElement):
         
         Tracks hover state for visual feedback and triggers callback on click.
         Respects disabled state. Returns True if click consumed.
+        
+        Note: Uses the event's own position (no pygame.mouse.get_pos() call) and
+              the cached absolute rect.
         """
         if self.disabled or not self.shown:
             return False
         
+        # Only mouse events carry a position
+        pos = getattr(event, "pos", None)
+        if pos is None:
+            return False
+        
         abs_rect = self.get_absolute_rect()
-        mouse_pos = pygame.mouse.get_pos()
         
         # Update hover state
-        is_hovering = abs_rect.collidepoint(mouse_pos)
+        is_hovering = abs_rect.collidepoint(pos[0], pos[1])
         if is_hovering != self.hovering:
             self.hovering = is_hovering
         
         # Handle click
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if abs_rect.collidepoint(event.pos):
+            if is_hovering:
                 self.trigger()
                 return True
         
@@ -188,22 +246,33 @@ class Button(UIElement):
         self.update()
         # Get absolute position for drawing
         abs_rect = self.get_absolute_rect()
+        # Nothing to draw if the button lies entirely outside the surface's clip area
+        if not abs_rect.colliderect(surface.get_clip()):
+            return
         
-        # Apply visual state modifications
-        draw_color = self.color
-        draw_text_color = self.text_color
-        
+        # Apply visual state modifications (all variants are precomputed by the color setters)
         if self.disabled:
             # Darken disabled buttons
-            draw_color = tuple(int(c * 0.5) for c in self.color)
-            draw_text_color = tuple(int(c * 0.5) for c in self.text_color)
+            look = "disabled"
+            draw_color = self._color_disabled_pg
+            draw_text_color = self._text_color_disabled
         elif self.hovering:
             # Lighten on hover
-            draw_color = tuple(min(255, int(c * 1.2)) for c in self.color)
+            look = "hover"
+            draw_color = self._color_hover_pg
+            draw_text_color = self.text_color
+        else:
+            look = "normal"
+            draw_color = self._color_pg
+            draw_text_color = self.text_color
         
-        # Draw using absolute rect
-        pygame.draw.rect(surface, draw_color, abs_rect, 0, self.border_radius, self.border_top_left_radius, self.border_top_right_radius, self.border_bottom_left_radius, self.border_bottom_right_radius)
-        text = self.game_font.render(self.text, False, draw_text_color)
+        # Draw using absolute rect: square corners are a plain fill, rounded ones blit a pre-drawn surface
+        radii = (self.border_radius, self.border_top_left_radius, self.border_top_right_radius, self.border_bottom_left_radius, self.border_bottom_right_radius)
+        if max(radii) > 0:
+            surface.blit(self._get_rounded_background(abs_rect.size, look, draw_color, radii), abs_rect.topleft)
+        else:
+            surface.fill(draw_color, abs_rect)
+        text = _render_text(self.game_font, self.text, draw_text_color)
         
         # Calculate text position based on absolute rect
         text_rect = text.get_rect()
@@ -217,19 +286,38 @@ class Button(UIElement):
         surface.blit(text, text_rect)
         self.draw_inactive_overlay(surface, abs_rect)
 
-        if self.is_active:
+        # Outside dev mode a clicked button stays is_active, but its outline is never drawn - skip the call
+        if self.is_active and self.game_manager.dev_mode:
             self.draw_guiding_lines(surface)
 
-    def get_text_rect(self, text_surface: pygame.Surface) -> pygame.Rect:
-        """Calculate text position based on alignment. Returns rect in relative coordinates."""
-        text_rect = text_surface.get_rect()
-        if self.text_align == "center":
-            text_rect.center = self.rect.center
-        elif self.text_align == "left":
-            text_rect.midleft = (self.rect.left + 5, self.rect.centery)
-        elif self.text_align == "right":
-            text_rect.midright = (self.rect.right - 5, self.rect.centery)
-        return text_rect
+    def _get_rounded_background(self, size: tuple[int, int], look: str, color: pygame.Color, radii: tuple) -> pygame.Surface:
+        """
+        Get the button background with rounded corners, drawing it once per look.
+        
+        Args:
+            size: Background (width, height)
+            look: Current visual state ("normal", "hover" or "disabled")
+            color: Fill color for that state
+            radii: (border_radius, top_left, top_right, bottom_left, bottom_right)
+        
+        Returns:
+            pygame.Surface: Transparent-cornered surface to blit at the button's position
+        
+        Note: Keyed by look rather than color (pygame.Color isn't hashable); the
+              color setter clears the cache, and it is also cleared if something
+              (e.g. a driver) keeps producing new sizes or radii.
+        """
+        key = (size, look, radii)
+        background = self._background_cache.get(key)
+        if background is None:
+            if len(self._background_cache) >= 8:
+                self._background_cache.clear()
+            background = pygame.Surface(size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                background = background.convert_alpha()
+            pygame.draw.rect(background, color, background.get_rect(), 0, *radii)
+            self._background_cache[key] = background
+        return background
 
     ## --- SERIALIZATION --- ##
 
@@ -242,10 +330,9 @@ class Button(UIElement):
 
         self._read_common_layout(layout)
 
-        field_names = {f.name for f in fields(ButtonInfo)}
         self.layout = ButtonInfo(
             common_layout=self.common_layout,
-            **{k: v for k, v in layout.items() if k in field_names and k != "common_layout"}
+            **{k: v for k, v in layout.items() if k in _BUTTON_FIELD_NAMES and k != "common_layout"}
         )
 
     def get_layout(self) -> ButtonInfo:
@@ -253,13 +340,9 @@ class Button(UIElement):
         Serialize button properties to config dict.
         
         Includes reverse callback lookup to save callback name (if registered).
-        Note: Nested loop for callback lookup - could be optimized with reverse registry.
         """
-
-        for name, func in self.game_manager.input_manager.ui_factory.callback_registry.items():
-                if func == self.callback:
-                    callback_name = name
-                    break
+        # O(1) reverse lookup; unregistered (or missing) callbacks save as ""
+        callback_name = self.game_manager.input_manager.ui_factory.callback_names.get(self.callback, "")
 
         layout = ButtonInfo(
             common_layout=self._get_common_layout(),
@@ -302,14 +385,17 @@ class Button(UIElement):
 class ButtonInfo:
     common_layout: UIElementInfo
     callback: str = ""
-    color: list[int] = field(default_factory=lambda: [255, 255, 255])
+    color: list[int] = Factory(lambda: [255, 255, 255])
     text_align: str = "center"
     text: str = ""
     padding: int = 5
     disabled: bool = False
-    text_color: list[int] = field(default_factory=lambda: [255, 255, 255])
+    text_color: list[int] = Factory(lambda: [255, 255, 255])
     border_radius: int = 0
     border_top_right_radius: int = 0
     border_top_left_radius: int = 0
     border_bottom_right_radius: int = 0
     border_bottom_left_radius: int = 0
+
+# Layout keys accepted by ButtonInfo, computed once at import instead of per read_layout call
+_BUTTON_FIELD_NAMES = frozenset(f.name for f in fields(ButtonInfo))
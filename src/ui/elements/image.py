@@ -47,8 +47,8 @@ class Image(UIElement):
         for name, value in vars(self.layout).items():
             setattr(self, name, value)
 
+        # The image file is loaded lazily by draw(), so screens that are never shown never touch disk
         self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        self._rebuild_surface()
 
     def _rebuild_surface(self) -> None:
         """Recreate display surface and scale image/fallback fill to current rect size."""
@@ -108,7 +108,7 @@ class Image(UIElement):
     def _invalidate_absolute_rect(self) -> None:
         """Invalidate cached absolute rect and rebuild image surface if size changed."""
         super()._invalidate_absolute_rect()
-        if not hasattr(self, 'surface'):
+        if not hasattr(self, 'surface') or self._last_surface_signature is None:
             return
         if self._last_surface_signature != self._get_surface_signature():
             self._rebuild_surface()
@@ -119,14 +119,13 @@ class Image(UIElement):
         """
         Load image properties and reload image if path changes.
         
-        Note: Reloads image if surface already exists (for runtime updates).
+        Note: Reloads image if it has already been drawn (for runtime updates).
         """
-        field_names = {f.name for f in fields(ImageInfo)}
         self.layout = ImageInfo(
             common_layout=self._get_common_layout(),
-            **{k: v for k, v in layout.items() if k in field_names}
+            **{k: v for k, v in layout.items() if k in _IMAGE_FIELD_NAMES}
         )
-        if hasattr(self, 'surface'):
+        if self._last_surface_signature is not None:
             self._rebuild_surface()
 
     def get_layout(self) -> ImageInfo:
@@ -147,4 +146,7 @@ class Image(UIElement):
 class ImageInfo:
     common_layout: UIElementInfo
     image_path: str = ""
-    default_color: list[int] = field(default_factory=lambda: [255, 255, 255])
\ No newline at end of file
+    default_color: list[int] = field(default_factory=lambda: [255, 255, 255])
+
+# Layout keys accepted by ImageInfo, computed once at import instead of per read_layout call
+_IMAGE_FIELD_NAMES = frozenset(f.name for f in fields(ImageInfo))
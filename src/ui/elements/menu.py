@@ -1,9 +1,9 @@
+import sys
 from dataclasses import field
 
 from attr import dataclass, fields
 import pygame
 from typing import Dict, TYPE_CHECKING
-from src.managers import *
 from src.ui.ui_element import UIElement, UIElementInfo
 from src.ui.elements.button import Button, ButtonInfo
 from src.ui.elements.toggle import Toggle, ToggleInfo
@@ -124,6 +124,10 @@ class Menu(UIElement):
                 continue
             setattr(self, name, value)
 
+        # Tab names key every per-tab collection lookup; intern them like element names
+        self.tabs = [sys.intern(tab) for tab in self.tabs]
+        self.active_tab = sys.intern(self.active_tab)
+
         raw_background_color = layout_props.get("background_color")
         if isinstance(raw_background_color, (list, tuple)) and len(raw_background_color) >= 3:
             self.background_color = tuple(raw_background_color[:3])
@@ -131,17 +135,19 @@ class Menu(UIElement):
         # Set initial location AFTER reading layout so init_location has the correct value
         self.location = self.init_location
         
-        # Create menu surface
+        # Create menu surface; recomposed only when its size, backdrop or color changes
         self.menu_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self._menu_surface_signature = None
+        self._compose_menu_surface()
         
-        if self.backdrop:
-            self.menu_surface.blit(pygame.transform.scale(self.backdrop, self.rect.size), (0, 0))
-        else:
-            self.menu_surface.fill(tuple(self.background_color))
-        
+        # Per-tab draw lists (children minus other tabs' elements), built lazily by _children_for_tab()
+        self._children_by_tab: dict[str, list[UIElement]] = {}
+
         # Add all UI elements to the hierarchy
         self._add_children_to_hierarchy()
         
+        # Tab whose visibility was last applied; draw() only reapplies when active_tab changes
+        self._applied_tab = None
         self.update_menu(time)
     
     ## --- HIERARCHY SETUP --- ##
@@ -176,6 +182,37 @@ class Menu(UIElement):
                 for text_display in self.text_displays[tab].values():
                     self.add_child(text_display)
     
+    def add_child(self, child: UIElement) -> None:
+        """Add a child and drop the cached per-tab draw lists."""
+        super().add_child(child)
+        self._children_by_tab = {}
+
+    def remove_child(self, child: UIElement) -> None:
+        """Remove a child and drop the cached per-tab draw lists."""
+        super().remove_child(child)
+        self._children_by_tab = {}
+
+    def _children_for_tab(self, tab: str) -> list[UIElement]:
+        """
+        Get the children that can be visible while `tab` is active, in draw order.
+        
+        Excludes elements belonging to the other tabs (update_menu keeps those
+        hidden); tab buttons and children added outside the tab collections are
+        always included. Cached per tab until the children list changes.
+        """
+        children = self._children_by_tab.get(tab)
+        if children is None:
+            other_tab_ids = {
+                id(element)
+                for collection in (self.buttons, self.toggles, self.sliders, self.images, self.text_displays)
+                for collection_tab, elements in collection.items()
+                if collection_tab != tab and collection_tab != "tabs"
+                for element in elements.values()
+            }
+            children = [child for child in self.children if id(child) not in other_tab_ids]
+            self._children_by_tab[tab] = children
+        return children
+
     ## --- MENU CONTROL --- ##
     
     def open_menu(self):
@@ -198,7 +235,8 @@ class Menu(UIElement):
         - Tab buttons ("tabs" key): Always shown
         - Other elements: Only shown if their tab == active_tab
         
-        This is called each frame during draw to update element visibility.
+        draw() calls this only when active_tab differs from the last applied
+        tab, so visibility is not rewritten every frame.
         """
         # Control visibility of children based on active tab
         # Tab buttons are always visible
@@ -208,33 +246,61 @@ class Menu(UIElement):
         
         # Show only elements for the active tab
         for tab in self.tabs:
-            is_active = (tab == self.active_tab)
-            
-            if tab in self.buttons:
-                for button in self.buttons[tab].values():
-                    button.shown = is_active
-            if tab in self.toggles:
-                for toggle in self.toggles[tab].values():
-                    toggle.shown = is_active
-            if tab in self.sliders:
-                for slider in self.sliders[tab].values():
-                    slider.shown = is_active
-            if tab in self.images:
-                for image in self.images[tab].values():
-                    image.shown = is_active
-            if tab in self.text_displays:
-                for text_display in self.text_displays[tab].values():
-                    text_display.shown = is_active
+            self._set_tab_shown(tab, tab == self.active_tab)
+        self._applied_tab = self.active_tab
+
+    def set_active_tab(self, new_tab: str) -> None:
+        """
+        Switch the active tab, touching only the outgoing and incoming tabs.
+        
+        Unlike update_menu(), which rewrites visibility for every tab, this only
+        hides the previous tab's elements and shows the new tab's elements.
+        """
+        previous_tab = self.active_tab
+        if previous_tab != new_tab:
+            self._set_tab_shown(previous_tab, False)
+        self.active_tab = new_tab
+        self._set_tab_shown(new_tab, True)
+        self._applied_tab = new_tab
+
+    def _set_tab_shown(self, tab: str, shown: bool) -> None:
+        """Set visibility for every element in a single tab."""
+        for collection in (self.buttons, self.toggles, self.sliders, self.images, self.text_displays):
+            if tab in collection:
+                for element in collection[tab].values():
+                    element.shown = shown
 
     ## --- RENDERING --- ##
 
+    def _compose_menu_surface(self) -> None:
+        """
+        Redraw the menu background onto menu_surface if anything it depends on changed.
+        
+        The background is the scaled backdrop image or a solid fill; it does not
+        depend on children (they draw straight to the screen), so it only needs
+        rebuilding when rect size, backdrop or background_color change.
+        """
+        signature = (self.rect.size, self.backdrop, self.background_color)
+        if signature == self._menu_surface_signature:
+            return
+
+        if self.menu_surface.get_size() != self.rect.size:
+            self.menu_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
+        if self.backdrop:
+            self.menu_surface.fill((0, 0, 0, 0))  # Clear
+            self.menu_surface.blit(pygame.transform.scale(self.backdrop, self.rect.size), (0, 0))
+        else:
+            self.menu_surface.fill(self.background_color)
+        self._menu_surface_signature = signature
+
     def draw(self, surface: pygame.Surface, time: int):
         """
         Draw menu background and all visible children.
         
         Process:
-        1. Update menu state (tab visibility)
-        2. Redraw background (backdrop image or solid color)
+        1. Update menu state (tab visibility) if the active tab changed
+        2. Recompose background (backdrop image or solid color) if it changed
         3. Draw menu surface at absolute position
         4. Draw all visible children (they handle their own positioning)
         5. Draw guiding lines if in dev mode
@@ -248,26 +314,22 @@ class Menu(UIElement):
         
         self.update()
 
-        # Update menu state
-        if time is not None:
+        # Update menu state only when the active tab was changed without set_active_tab()
+        if time is not None and self._applied_tab != self.active_tab:
             self.update_menu(time)
         
         # Use absolute rect for drawing (combines rect with location)
         abs_rect = self.get_absolute_rect()
         
-        # Redraw background
-        if self.backdrop:
-            self.menu_surface.fill((0, 0, 0, 0))  # Clear
-            self.menu_surface.blit(pygame.transform.scale(self.backdrop, self.rect.size), (0, 0))
-        else:
-            self.menu_surface.fill(self.background_color)
+        # Redraw background only if it changed since the last frame
+        self._compose_menu_surface()
         
         # Draw menu surface at absolute position
         surface.blit(self.menu_surface, abs_rect.topleft)
         self.draw_inactive_overlay(surface, abs_rect)
         
-        # Draw children (they handle their own absolute positioning)
-        for child in self.children:
+        # Draw children (they handle their own absolute positioning); other tabs' elements are skipped outright
+        for child in self._children_for_tab(self.active_tab):
             if child.shown:
                 child.draw(surface, time) # type: ignore
         
@@ -347,10 +409,9 @@ class Menu(UIElement):
         # Read common properties first
         self._read_common_layout(layout_props)
 
-        field_names = {f.name for f in fields(MenuInfo)}
         self.layout = MenuInfo(
             common_layout=self._get_common_layout(),
-            **{k: v for k, v in layout_props.items() if k in field_names}
+            **{k: v for k, v in layout_props.items() if k in _MENU_FIELD_NAMES}
         )
         
         #TODO: commented out because, at least for buttons, read_layout is being called twice, delete after testing
@@ -456,4 +517,7 @@ class MenuInfo:
     toggles: dict[str, dict[str, ToggleInfo]] | None = None
     sliders: dict[str, dict[str, SliderInfo]] | None = None
     images: dict[str, dict[str, ImageInfo]] | None = None
-    text_displays: dict[str, dict[str, TextDisplayInfo]] | None = None
\ No newline at end of file
+    text_displays: dict[str, dict[str, TextDisplayInfo]] | None = None
+
+# Layout keys accepted by MenuInfo, computed once at import instead of per read_layout call
+_MENU_FIELD_NAMES = frozenset(f.name for f in fields(MenuInfo))
@@ -530,10 +530,9 @@ class ScrollableArea(UIElement):
         """
         self._read_common_layout(layout_props)
 
-        field_names = {f.name for f in fields(ScrollableAreaInfo)}
         self.layout = ScrollableAreaInfo(
             common_layout=self._get_common_layout(),
-            **{k: v for k, v in layout_props.items() if k in field_names}
+            **{k: v for k, v in layout_props.items() if k in _SCROLLABLE_AREA_FIELD_NAMES}
         )
         
         # Store pending content elements for deferred loading
@@ -618,4 +617,7 @@ class ScrollableAreaInfo:
     content_background_color: list[int] = field(default_factory=lambda: [200, 200, 200, 255])
     slider_side: str = "right"
     slider_handle_inset: int = 5
-    content_width_percentage: float = .90
\ No newline at end of file
+    content_width_percentage: float = .90
+
+# Layout keys accepted by ScrollableAreaInfo, computed once at import instead of per read_layout call
+_SCROLLABLE_AREA_FIELD_NAMES = frozenset(f.name for f in fields(ScrollableAreaInfo))
@@ -347,10 +347,9 @@ class Slider(UIElement):
         # Schema ref: See [layout.json](./config/layout.json#L188-215)
         self._read_common_layout(layout_props)
 
-        field_names = {f.name for f in fields(SliderInfo)}
         self.layout = SliderInfo(
             common_layout=self._get_common_layout(),
-            **{k: v for k, v in layout_props.items() if k in field_names}
+            **{k: v for k, v in layout_props.items() if k in _SLIDER_FIELD_NAMES}
         )
     
     def get_layout(self) -> SliderInfo:
@@ -391,4 +390,7 @@ class SliderInfo:
     handle_radius: int = 10
     direction: str = "horizontal"
     handle_shape: str = "circle"
-    handle_length: int = 20
\ No newline at end of file
+    handle_length: int = 20
+
+# Layout keys accepted by SliderInfo, computed once at import instead of per read_layout call
+_SLIDER_FIELD_NAMES = frozenset(f.name for f in fields(SliderInfo))
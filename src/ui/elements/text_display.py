@@ -1,7 +1,6 @@
 from dataclasses import dataclass, field, fields, fields
 
 import pygame
-import math
 
 from typing import TYPE_CHECKING, Callable, Optional
 from src.ui.ui_element import UIElement, UIElementInfo
@@ -96,12 +95,13 @@ class TextDisplay(UIElement):
         - "left": Left edge + padding, vertically centered
         - "right": Right edge - padding, vertically centered
         """
+        surface_rect = self.surface.get_rect()
         if text_align == "center":
-            self.text_rect.center = self.surface.get_rect().center
+            self.text_rect.center = surface_rect.center
         elif text_align == "left":
-            self.text_rect.midleft = (self.padding, self.surface.get_rect().centery)
+            self.text_rect.midleft = (self.padding, surface_rect.centery)
         elif text_align == "right":
-            self.text_rect.midright = (self.surface.get_rect().width - self.padding, self.surface.get_rect().centery)
+            self.text_rect.midright = (surface_rect.width - self.padding, surface_rect.centery)
 
     def update_text(self, new_text: str) -> None:
         """Update displayed text and re-render surface."""
@@ -152,10 +152,9 @@ class TextDisplay(UIElement):
         # Schema reference: See [layout.json](./config/layout.json#L219-L239)
         self._read_common_layout(layout_props)
 
-        field_names = {f.name for f in fields(TextDisplayInfo)}
         self.layout = TextDisplayInfo(
             common_layout=self._get_common_layout(),
-            **{k: v for k, v in layout_props.items() if k in field_names}
+            **{k: v for k, v in layout_props.items() if k in _TEXT_DISPLAY_FIELD_NAMES}
         )
 
     def get_layout(self) -> TextDisplayInfo:
@@ -202,4 +201,7 @@ class TextDisplayInfo:
     border_top_right_radius: int = 0
     border_top_left_radius: int = 0
     border_bottom_right_radius: int = 0
-    border_bottom_left_radius: int = 0
\ No newline at end of file
+    border_bottom_left_radius: int = 0
+
+# Layout keys accepted by TextDisplayInfo, computed once at import instead of per read_layout call
+_TEXT_DISPLAY_FIELD_NAMES = frozenset(f.name for f in fields(TextDisplayInfo))
@@ -88,10 +88,12 @@ class Toggle(UIElement):
         self.animating = False
         self._anim_from_on = self.on
         self._anim_to_on = self.on
-        if not self.on:
-            self.toggle_center_location = (self.height // 2, self.height // 2) 
-        else:
-            self.toggle_center_location = (self.center_width + self.height // 2, self.height // 2)
+
+        # Precompute the handle's resting centers; only the eased x changes while animating
+        half_height = self.height // 2
+        self._off_center = (half_height, half_height)
+        self._on_center = (self.center_width + half_height, half_height)
+        self.toggle_center_location = self._on_center if self.on else self._off_center
 
         #Create the toggle's background surface
         self.surface = pygame.Surface((self.center_width + self.height, self.height), pygame.SRCALPHA)
@@ -109,6 +111,8 @@ class Toggle(UIElement):
         self.toggle_circle = pygame.Surface((self.height - self.toggle_gap * 2, self.height - self.toggle_gap * 2), pygame.SRCALPHA)
         self.toggle_circle.fill((0, 0, 0, 0))  # Transparent background
         pygame.draw.circle(self.toggle_circle, self.handle_color, self.toggle_circle.get_rect().center, self.handle_radius)
+        handle_w, handle_h = self.toggle_circle.get_size()
+        self._handle_half_size = (handle_w / 2, handle_h / 2)
     
     ## --- EVENT HANDLING --- ##
     
@@ -173,17 +177,15 @@ class Toggle(UIElement):
         if self.animating:
             if new_time >= self.end_time:
                 self.animating = False
-                if self.on:
-                    self.toggle_center_location = (self.center_width + self.height // 2, self.height // 2)
-                else:
-                    self.toggle_center_location = (self.height // 2, self.height // 2)
+                self.toggle_center_location = self._on_center if self.on else self._off_center
                 return
             progress = (new_time - self.start_time) / (self.end_time - self.start_time)
             progress = tween.easeInOutCubic(progress)
+            off_x, center_y = self._off_center
             if not self._anim_from_on and self._anim_to_on:
-                self.toggle_center_location = (self.height // 2 + int((self.center_width) * progress), self.height // 2)
+                self.toggle_center_location = (off_x + int(self.center_width * progress), center_y)
             else:
-                self.toggle_center_location = (self.center_width + self.height // 2 - int((self.center_width) * progress), self.height // 2)
+                self.toggle_center_location = (self._on_center[0] - int(self.center_width * progress), center_y)
 
     ## --- RENDERING --- ##
 
@@ -223,7 +225,9 @@ class Toggle(UIElement):
         if self.guiding_lines:
             pygame.draw.line(self.surface, (100, 100, 200), (0, self.height / 2), (self.height + self. center_width, self.height / 2), 1)
             pygame.draw.line(self.surface, (100, 100, 200), ((self.height + self.center_width) / 2, 0), ((self.height + self.center_width) / 2, self.height), 1)
-        self.surface.blit(self.toggle_circle, (self.toggle_center_location[0] - self.toggle_circle.get_size()[0] / 2, self.toggle_center_location[1] - self.toggle_circle.get_size()[1] / 2))
+        center_x, center_y = self.toggle_center_location
+        half_w, half_h = self._handle_half_size
+        self.surface.blit(self.toggle_circle, (center_x - half_w, center_y - half_h))
         surface.blit(self.surface, abs_rect.topleft)
         self.draw_inactive_overlay(surface, abs_rect)
 
@@ -236,21 +240,21 @@ class Toggle(UIElement):
         """
         Load toggle properties from config dict and recalculate dependent values.
         
-        Dependent properties (calculated from height and toggle_gap):
+        Dependent properties (calculated from the layout's height and toggle_gap):
         - radius: height / 2
         - handle_radius: height / 2 - toggle_gap
         """
         # Schema reference: See [layout.json](./config/layout.json#L442-L465)
         self._read_common_layout(layout_props)
 
-        field_names = {f.name for f in fields(ToggleInfo)}
         self.layout = ToggleInfo(
             common_layout=self._get_common_layout(),
-            **{k: v for k, v in layout_props.items() if k in field_names})
+            **{k: v for k, v in layout_props.items() if k in _TOGGLE_FIELD_NAMES})
 
-        # Recalculate dependent properties
-        self.radius = self.height / 2
-        self.handle_radius = self.height / 2 - self.toggle_gap
+        # Recalculate dependent properties from the values being loaded; the
+        # constructor only copies layout fields onto self after read_layout returns
+        self.radius = self.layout.height / 2
+        self.handle_radius = self.layout.height / 2 - self.layout.toggle_gap
         
     def get_layout(self) -> ToggleInfo:
         """Serialize toggle properties including current state (on/off)."""
@@ -286,4 +290,7 @@ class ToggleInfo:
     color: list[int] = field(default_factory=lambda: [100, 100, 100, 255])
     handle_color: list[int] = field(default_factory=lambda: [255, 255, 0, 255])
     toggle_gap: int = 5
-    time_to_flip: float = 0.5
\ No newline at end of file
+    time_to_flip: float = 0.5
+
+# Layout keys accepted by ToggleInfo, computed once at import instead of per read_layout call
+_TOGGLE_FIELD_NAMES = frozenset(f.name for f in fields(ToggleInfo))
@@ -61,8 +61,10 @@ class TextInput:
         # Schema reference: See [layout.json](./config/layout.json#L240-L260)
         
         self.name = layout_props.get("name", self.name)
-        rect_data = layout_props.get("rect", [self.rect.x, self.rect.y, self.rect.width, self.rect.height])
-        self.rect = pygame.Rect(rect_data[0], rect_data[1], rect_data[2], rect_data[3])
+        rect_data = layout_props.get("rect")
+        if rect_data is not None:
+            #update the existing rect in place instead of allocating a new one on every re-read
+            self.rect.update(rect_data[0], rect_data[1], rect_data[2], rect_data[3])
         color_data = layout_props.get("color", [self.background_color[0], self.background_color[1], self.background_color[2]])
         self.background_color = (color_data[0], color_data[1], color_data[2])
         self.text = layout_props.get("text", self.text)
@@ -1,3 +1,5 @@
+import sys
+
 from attr import dataclass, fields
 import pygame
 from abc import ABC, abstractmethod
@@ -81,7 +83,7 @@ class UIElement(ABC):
         self.name = ""
         self.rect = pygame.Rect(0, 0, 0, 0)  # Position relative to parent
         self.offset = (0, 0)
-        self.guiding_line_color = (100, 100, 200)
+        self.guiding_line_color = pygame.Color(100, 100, 200)  # Color instance: draw calls skip re-parsing it
         self.guiding_lines_on = False
         self.is_active = False
         self.active = True
@@ -709,7 +711,7 @@ class UIElement(ABC):
             surface: pygame.Surface to draw on (usually screen)
         
         Visual:
-        - Draws 4 lines forming rectangle around element bounds
+        - Draws a closed 4-point outline around element bounds in one call
         - Color: self.guiding_line_color (default: blue)
         - Width: 1 pixel
         - Uses absolute coordinates (screen space)
@@ -723,18 +725,11 @@ class UIElement(ABC):
         """
         if self.game_manager.dev_mode:
             abs_rect = self.get_absolute_rect()
-            pygame.draw.line(surface, self.guiding_line_color, 
-                           (abs_rect.x, abs_rect.y), 
-                           (abs_rect.x + abs_rect.width, abs_rect.y), 1)
-            pygame.draw.line(surface, self.guiding_line_color, 
-                           (abs_rect.x, abs_rect.y), 
-                           (abs_rect.x, abs_rect.y + abs_rect.height), 1)
-            pygame.draw.line(surface, self.guiding_line_color, 
-                           (abs_rect.x + abs_rect.width, abs_rect.y), 
-                           (abs_rect.x + abs_rect.width, abs_rect.y + abs_rect.height), 1)
-            pygame.draw.line(surface, self.guiding_line_color, 
-                           (abs_rect.x, abs_rect.y + abs_rect.height), 
-                           (abs_rect.x + abs_rect.width, abs_rect.y + abs_rect.height), 1)
+            # Corners at x + width / y + height (not rect.right - 1) to match the previous line-based outline
+            left, top = abs_rect.x, abs_rect.y
+            right, bottom = left + abs_rect.width, top + abs_rect.height
+            pygame.draw.lines(surface, self.guiding_line_color, True,
+                              ((left, top), (right, top), (right, bottom), (left, bottom)), 1)
 
     def draw_inactive_overlay(self, surface: pygame.Surface, abs_rect: Optional[pygame.Rect] = None) -> None:
         """Draw translucent gray overlay to indicate deactivated state."""
@@ -776,20 +771,20 @@ class UIElement(ABC):
             self.my_property = layout_props.get('my_property', default)  # Then
         ```
         """
-        rect_values = layout_props.get("rect", [self.rect.x, self.rect.y, self.rect.width, self.rect.height])
+        # Update the existing Rect in place; a missing "rect" keeps the current one as-is
+        rect_values = layout_props.get("rect")
         if isinstance(rect_values, (list, tuple)) and len(rect_values) == 4:
-            self.rect = pygame.Rect(*rect_values)
+            self.rect.update(*rect_values)
 
         name_value = layout_props.get("name", self.name)
         if isinstance(name_value, str):
-            self.name = name_value
+            # Names are dict keys for collections, callbacks and lookups;
+            # interning lets those lookups short-circuit on identity
+            self.name = sys.intern(name_value)
 
-        line_color = layout_props.get(
-            "guiding_line_color",
-            [self.guiding_line_color[0], self.guiding_line_color[1], self.guiding_line_color[2]],
-        )
+        line_color = layout_props.get("guiding_line_color")
         if isinstance(line_color, (list, tuple)) and len(line_color) >= 3:
-            self.guiding_line_color = (line_color[0], line_color[1], line_color[2])
+            self.guiding_line_color = pygame.Color(line_color[0], line_color[1], line_color[2])
 
         self.guiding_lines_on = bool(layout_props.get("guiding_lines_on", self.guiding_lines_on))
         self.active = bool(layout_props.get("active", self.active))